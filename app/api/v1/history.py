@@ -5,46 +5,109 @@ This module provides endpoints for accessing historical sentiment analysis
 results, session data, and analytics.
 """
 
+import asyncio
 import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as _PageResponse
+
+    def _ndjson_line(obj: Any) -> bytes:
+        return orjson.dumps(obj) + b"\n"
+except ImportError:  # orjson not installed - fall back to stdlib json
+    import json
+
+    _PageResponse = JSONResponse
+
+    def _ndjson_line(obj: Any) -> bytes:
+        return (json.dumps(obj) + "\n").encode("utf-8")
 
 from app.database.repositories.sentiment_repository import sentiment_repository, user_session_repository
 from app.models.database import SentimentResult, UserSession
+from app.services.cache_service import analytics_cache
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/history", tags=["history"])
 
 
+def _parse_history_cursor(cursor: str) -> tuple:
+    """
+    Parse a "{timestamp}|{id}" pagination cursor into its components.
+
+    Args:
+        cursor: The opaque cursor string from a previous page
+
+    Returns:
+        Tuple of (timestamp, id) for the keyset filter
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    raw_timestamp, separator, last_id = cursor.partition("|")
+    if not separator or not last_id:
+        raise ValueError("cursor must be '{timestamp}|{id}'")
+    return datetime.fromisoformat(raw_timestamp), last_id
+
+
 @router.get("/results/{session_id}")
 async def get_session_history(
     session_id: str,
     limit: int = Query(default=100, ge=1, le=1000, description="Maximum number of results to return"),
-    skip: int = Query(default=0, ge=0, description="Number of results to skip for pagination")
-) -> Dict[str, Any]:
+    skip: int = Query(default=0, ge=0, description="Number of results to skip for pagination"),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Keyset cursor from a previous page's next_cursor; takes precedence over skip"
+    )
+) -> JSONResponse:
     """
     Get sentiment analysis history for a specific session.
-    
+
     Args:
         session_id: The session identifier
         limit: Maximum number of results to return (1-1000)
         skip: Number of results to skip for pagination
-        
+        cursor: Keyset cursor ("{timestamp}|{id}") from a previous
+            page; deep pages resume from an index seek instead of
+            paying skip/limit
+
     Returns:
         Dict containing the results and pagination info
     """
+    before = None
+    if cursor is not None:
+        try:
+            before = _parse_history_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
     try:
-        # Get sentiment results for the session
-        results = await sentiment_repository.get_by_session_id(
-            session_id=session_id,
-            limit=limit,
-            skip=skip
+        # The results page and the session info are independent queries, so
+        # run them concurrently. The extra result in limit+1 lets has_more
+        # reflect the actual presence of a next page instead of guessing
+        # from a full page.
+        results, sessions = await asyncio.gather(
+            sentiment_repository.get_by_session_id(
+                session_id=session_id,
+                limit=limit + 1,
+                skip=None if before is not None else skip,
+                before=before
+            ),
+            user_session_repository.get_many(
+                filter_dict={"session_id": session_id},
+                limit=1
+            )
         )
-        
+
+        has_more = len(results) > limit
+        if has_more:
+            results = results[:limit]
+
         # Convert to response format
         response_results = []
         for result in results:
@@ -61,11 +124,6 @@ async def get_session_history(
             })
         
         # Get session info
-        sessions = await user_session_repository.get_many(
-            filter_dict={"session_id": session_id},
-            limit=1
-        )
-        
         session_info = None
         if sessions:
             session = sessions[0]
@@ -77,7 +135,16 @@ async def get_session_history(
                 "models_used": session.models_used
             }
         
-        return {
+        # Cursor for the next page: results are ordered by timestamp
+        # descending, so the last row marks where the next page starts
+        next_cursor = None
+        if has_more and results:
+            last = results[-1]
+            next_cursor = f"{last.timestamp.isoformat()}|{last.id}"
+
+        # Return a Response directly so FastAPI skips its per-field
+        # response-model serialization pass over potentially 1000 rows
+        return _PageResponse({
             "session_id": session_id,
             "session_info": session_info,
             "results": response_results,
@@ -85,9 +152,10 @@ async def get_session_history(
                 "limit": limit,
                 "skip": skip,
                 "count": len(response_results),
-                "has_more": len(response_results) == limit
+                "has_more": has_more,
+                "next_cursor": next_cursor
             }
-        }
+        })
         
     except Exception as e:
         logger.error(f"Error retrieving session history: {e}")
@@ -97,11 +165,53 @@ async def get_session_history(
         )
 
 
+@router.get("/results/{session_id}/stream")
+async def stream_session_history(
+    session_id: str,
+    limit: int = Query(default=1000, ge=1, le=10000, description="Maximum number of results to stream")
+) -> StreamingResponse:
+    """
+    Stream sentiment analysis history for a session as NDJSON.
+
+    Results are emitted one line at a time as the database cursor yields
+    them, so large sessions never need to be held in memory and the first
+    byte reaches the client after a single document fetch.
+
+    Args:
+        session_id: The session identifier
+        limit: Maximum number of results to stream
+
+    Returns:
+        StreamingResponse: One JSON object per line (application/x-ndjson)
+    """
+    async def generate():
+        try:
+            async for result in sentiment_repository.stream_by_session_id(
+                session_id=session_id,
+                limit=limit
+            ):
+                yield _ndjson_line({
+                    "id": result.id,
+                    "text": result.text,
+                    "model_name": result.model_name,
+                    "label": result.label,
+                    "confidence": result.confidence,
+                    "scores": result.scores,
+                    "text_length": result.text_length,
+                    "processing_time_ms": result.processing_time_ms,
+                    "timestamp": result.timestamp.isoformat()
+                })
+        except Exception as e:
+            logger.error(f"Error streaming session history: {e}")
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.get("/results/recent")
 async def get_recent_results(
     hours: int = Query(default=24, ge=1, le=168, description="Number of hours to look back (max 1 week)"),
     limit: int = Query(default=100, ge=1, le=1000, description="Maximum number of results to return")
-) -> Dict[str, Any]:
+) -> JSONResponse:
     """
     Get recent sentiment analysis results across all sessions.
     
@@ -113,11 +223,17 @@ async def get_recent_results(
         Dict containing recent results
     """
     try:
+        # Probe with limit+1 so has_more reflects the actual presence of
+        # more rows rather than guessing from a full page
         results = await sentiment_repository.get_recent_results(
             hours=hours,
-            limit=limit
+            limit=limit + 1
         )
-        
+
+        has_more = len(results) > limit
+        if has_more:
+            results = results[:limit]
+
         # Convert to response format
         response_results = []
         for result in results:
@@ -131,12 +247,15 @@ async def get_recent_results(
                 "processing_time_ms": result.processing_time_ms,
                 "timestamp": result.timestamp.isoformat()
             })
-        
-        return {
+
+        # Bypass FastAPI's response-model pass for the same reason as the
+        # session-history page
+        return _PageResponse({
             "hours_back": hours,
             "results": response_results,
-            "count": len(response_results)
-        }
+            "count": len(response_results),
+            "has_more": has_more
+        })
         
     except Exception as e:
         logger.error(f"Error retrieving recent results: {e}")
@@ -162,9 +281,12 @@ async def get_sentiment_distribution(
         Dict containing sentiment label distribution
     """
     try:
-        distribution = await sentiment_repository.get_sentiment_distribution(
-            session_id=session_id,
-            hours=hours
+        distribution = await analytics_cache.get_or_compute(
+            ("sentiment_distribution", session_id, hours),
+            lambda: sentiment_repository.get_sentiment_distribution(
+                session_id=session_id,
+                hours=hours
+            )
         )
         
         total_count = sum(distribution.values())
@@ -211,9 +333,12 @@ async def get_model_performance(
         Dict containing model performance statistics
     """
     try:
-        stats = await sentiment_repository.get_model_performance_stats(
-            model_name=model_name,
-            hours=hours
+        stats = await analytics_cache.get_or_compute(
+            ("model_performance", model_name, hours),
+            lambda: sentiment_repository.get_model_performance_stats(
+                model_name=model_name,
+                hours=hours
+            )
         )
         
         return {
@@ -278,7 +403,10 @@ async def get_confidence_overview() -> Dict[str, Any]:
     """
     try:
         # Get confidence overview stats from repository
-        overview = await sentiment_repository.get_confidence_overview()
+        overview = await analytics_cache.get_or_compute(
+            ("confidence_overview",),
+            sentiment_repository.get_confidence_overview
+        )
         
         return overview
         
@@ -356,46 +484,10 @@ async def get_model_usage(
         Dict containing model usage statistics
     """
     try:
-        from datetime import datetime, timezone, timedelta
-        
-        # Get recent results
-        results = await sentiment_repository.get_recent_results(
-            hours=hours,
-            limit=10000  # High limit to get comprehensive data
-        )
-        
-        # Calculate model usage statistics
-        model_stats = {}
-        
-        for result in results:
-            model_name = result.model_name
-            if model_name not in model_stats:
-                model_stats[model_name] = {
-                    "total_requests": 0,
-                    "avg_confidence": 0,
-                    "avg_processing_time": 0,
-                    "sentiment_counts": {}
-                }
-            
-            stats = model_stats[model_name]
-            stats["total_requests"] += 1
-            
-            # Update averages (simple running average)
-            n = stats["total_requests"]
-            stats["avg_confidence"] = ((stats["avg_confidence"] * (n-1)) + result.confidence) / n
-            stats["avg_processing_time"] = ((stats["avg_processing_time"] * (n-1)) + result.processing_time_ms) / n
-            
-            # Count sentiment labels
-            label = result.label
-            if label not in stats["sentiment_counts"]:
-                stats["sentiment_counts"][label] = 0
-            stats["sentiment_counts"][label] += 1
-        
-        # Round averages for better readability
-        for model_name, stats in model_stats.items():
-            stats["avg_confidence"] = round(stats["avg_confidence"], 3)
-            stats["avg_processing_time"] = round(stats["avg_processing_time"], 2)
-        
+        # Aggregate usage statistics server-side instead of pulling raw
+        # result documents and looping over them here
+        model_stats = await sentiment_repository.get_model_usage_stats(hours=hours)
+
         return {
             "hours_analyzed": hours,
             "models": model_stats,
@@ -5,33 +5,87 @@ This module provides the main sentiment analysis functionality with
 database storage for results and session tracking.
 """
 
+import asyncio
 import logging
+import secrets
 import time
-import uuid
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, NamedTuple, Optional, Any
 
-from fastapi import APIRouter, HTTPException, Request, Depends
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, Depends
+from fastapi.responses import JSONResponse, Response
+
+# Optional: service-to-service callers can request msgpack-encoded batch
+# responses, which are smaller and faster to encode than JSON for these
+# float/string-heavy payloads. Browsers keep getting JSON.
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 from datetime import datetime, timezone
 
 from app.models.requests import SentimentAnalysisRequest, BatchSentimentRequest
 from app.models.responses import (
-    SentimentAnalysisResponse, 
+    SentimentAnalysisResponse,
     BatchSentimentResponse,
     HealthResponse,
     SentimentResult as SentimentResultResponse,
-    SentimentScore
+    SentimentScore,
+    SINGLE_ANALYSIS_ADAPTER,
+    BATCH_ANALYSIS_ADAPTER
 )
 from app.models.database import SentimentResult as SentimentResultDB
 from app.database.repositories.sentiment_repository import sentiment_repository, user_session_repository
 from app.services.sentiment_analyzer import SentimentAnalyzer
-from app.config import settings
+from app.config import settings, response_class
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import: ORJSONResponse when available, JSONResponse
+# otherwise. Returning a Response instance directly lets the hot endpoints
+# skip FastAPI's response-model re-validation and jsonable_encoder pass.
+_response_cls = response_class()
+
 router = APIRouter(prefix="/sentiment", tags=["sentiment"])
 
+# Cache of loaded analyzers keyed by model name. Creating a SentimentAnalyzer
+# (and implicitly loading its model) per request dominates latency for
+# transformer-backed models, so instances are long-lived and shared.
+_analyzer_cache: Dict[str, SentimentAnalyzer] = {}
+_analyzer_lock: Optional[asyncio.Lock] = None  # Created lazily to bind to the running loop
+
+
+def _get_analyzer_lock() -> asyncio.Lock:
+    """Get the analyzer cache lock, creating it if it doesn't exist."""
+    global _analyzer_lock
+    if _analyzer_lock is None:
+        _analyzer_lock = asyncio.Lock()
+    return _analyzer_lock
+
+
+async def get_analyzer(model_name: str) -> SentimentAnalyzer:
+    """
+    Get a cached SentimentAnalyzer for the given model, loading it on first use.
+
+    Args:
+        model_name: Name of the sentiment model
+
+    Returns:
+        SentimentAnalyzer: A loaded, shared analyzer instance
+    """
+    analyzer = _analyzer_cache.get(model_name)
+    if analyzer is not None:
+        return analyzer
+
+    async with _get_analyzer_lock():
+        # Re-check under the lock in case another request loaded it first
+        analyzer = _analyzer_cache.get(model_name)
+        if analyzer is None:
+            analyzer = SentimentAnalyzer(model_name=model_name)
+            await analyzer.load_model()
+            _analyzer_cache[model_name] = analyzer
+        return analyzer
+
 
 def get_session_id(request: Request) -> str:
     """
@@ -43,13 +97,13 @@ def get_session_id(request: Request) -> str:
     Returns:
         str: Session ID (from header or newly generated)
     """
-    # Try to get session ID from header
-    session_id = request.headers.get("X-Session-ID")
-    
+    # Try to get session ID from header (single header scan)
+    session_id = request.headers.get("x-session-id")
+
     if not session_id:
-        # Generate a new session ID
-        session_id = str(uuid.uuid4())
-        logger.debug(f"Generated new session ID: {session_id}")
+        # Generate a new session ID: one urandom read, no UUID object
+        session_id = secrets.token_hex(16)
+        logger.debug("Generated new session ID: %s", session_id)
     
     return session_id
 
@@ -64,41 +118,106 @@ def get_client_info(request: Request) -> tuple[Optional[str], Optional[str]]:
     Returns:
         tuple: (user_agent, ip_address)
     """
-    user_agent = request.headers.get("User-Agent")
-    
-    # Get IP address, considering proxy headers
-    ip_address = (
-        request.headers.get("X-Forwarded-For", "").split(",")[0].strip() or
-        request.headers.get("X-Real-IP") or
-        request.client.host if request.client else None
-    )
-    
+    headers = request.headers
+    user_agent = headers.get("user-agent")
+
+    # Get IP address, considering proxy headers; only split the
+    # X-Forwarded-For list when the header is actually present
+    forwarded_for = headers.get("x-forwarded-for")
+    if forwarded_for:
+        ip_address = forwarded_for.split(",", 1)[0].strip()
+    else:
+        ip_address = (
+            headers.get("x-real-ip") or
+            (request.client.host if request.client else None)
+        )
+
     return user_agent, ip_address
 
 
-@router.post("/analyze")
+class ClientContext(NamedTuple):
+    """Per-request client identity, parsed from headers exactly once."""
+    session_id: str
+    user_agent: Optional[str]
+    ip_address: Optional[str]
+
+
+def get_client_context(request: Request) -> ClientContext:
+    """
+    Resolve session ID and client info once per request.
+
+    The context is cached on request.state so every consumer within the
+    same request shares one header parse.
+
+    Args:
+        request: FastAPI request object
+
+    Returns:
+        ClientContext: (session_id, user_agent, ip_address)
+    """
+    ctx = getattr(request.state, "client_ctx", None)
+    if ctx is None:
+        user_agent, ip_address = get_client_info(request)
+        ctx = ClientContext(
+            session_id=get_session_id(request),
+            user_agent=user_agent,
+            ip_address=ip_address
+        )
+        request.state.client_ctx = ctx
+    return ctx
+
+
+async def _store_analysis_result(
+    sentiment_result: SentimentResultDB,
+    session_id: str,
+    model_name: str
+) -> None:
+    """
+    Persist a sentiment result and update session activity.
+
+    Runs as a background task so the DB round-trips stay off the
+    response path. Failures are logged but never surfaced to the client.
+    """
+    try:
+        await sentiment_repository.create(sentiment_result)
+
+        # Update session activity
+        await user_session_repository.update_session_activity(
+            session_id=session_id,
+            model_name=model_name
+        )
+
+        # DEBUG with lazy args: this fires on every request, so the message
+        # should only be formatted when the level is actually enabled
+        logger.debug("Stored sentiment result for session %s", session_id)
+
+    except Exception as e:
+        logger.error("Failed to store sentiment result: %s", e)
+
+
+@router.post("/analyze", response_model=SentimentAnalysisResponse)
 async def analyze_sentiment(
     request_data: SentimentAnalysisRequest,
     request: Request,
-    session_id: str = Depends(get_session_id)
-) -> SentimentAnalysisResponse:
+    background_tasks: BackgroundTasks,
+    client_ctx: ClientContext = Depends(get_client_context)
+):
     """
     Analyze sentiment of a single text input.
-    
+
     Args:
         request_data: The sentiment analysis request
         request: FastAPI request object
-        session_id: Session identifier
-        
+        client_ctx: Session and client info parsed once per request
+
     Returns:
         SentimentAnalysisResponse: Analysis results with confidence scores
     """
     start_time = time.time()
-    
+
     try:
-        # Get client information
-        user_agent, ip_address = get_client_info(request)
-        
+        session_id, user_agent, ip_address = client_ctx
+
         # Create or update user session
         await user_session_repository.get_or_create_session(
             session_id=session_id,
@@ -106,11 +225,9 @@ async def analyze_sentiment(
             ip_address=ip_address
         )
         
-        # Initialize sentiment analyzer
-        analyzer = SentimentAnalyzer(
-            model_name=request_data.model_name or settings.DEFAULT_MODEL
-        )
-        
+        # Resolve a cached sentiment analyzer
+        analyzer = await get_analyzer(request_data.model_name or settings.DEFAULT_MODEL)
+
         # Perform sentiment analysis
         result = await analyzer.analyze_text(
             text=request_data.text,
@@ -120,42 +237,35 @@ async def analyze_sentiment(
         # Calculate processing time
         processing_time_ms = (time.time() - start_time) * 1000
         
-        # Store result in database
-        try:
-            sentiment_result = SentimentResultDB(
-                session_id=session_id,
-                text=request_data.text,
-                model_name=result.get("model", analyzer.model_name),
-                label=result["sentiment"],
-                confidence=result["confidence"],
-                scores=result.get("scores", {}),
-                text_length=len(request_data.text),
-                processing_time_ms=processing_time_ms,
-                user_agent=user_agent,
-                ip_address=ip_address
-            )
-            
-            await sentiment_repository.create(sentiment_result)
-            
-            # Update session activity
-            await user_session_repository.update_session_activity(
-                session_id=session_id,
-                model_name=analyzer.model_name
-            )
-            
-            logger.info(f"Stored sentiment result for session {session_id}")
-            
-        except Exception as e:
-            logger.error(f"Failed to store sentiment result: {e}")
-            # Continue without failing the request
-        
-        # Prepare response
+        # Store result in database after the response is sent
+        sentiment_result = SentimentResultDB(
+            session_id=session_id,
+            text=request_data.text,
+            model_name=result.get("model", analyzer.model_name),
+            label=result["sentiment"],
+            confidence=result["confidence"],
+            scores=result.get("scores", {}),
+            text_length=len(request_data.text),
+            processing_time_ms=processing_time_ms,
+            user_agent=user_agent,
+            ip_address=ip_address
+        )
+
+        background_tasks.add_task(
+            _store_analysis_result,
+            sentiment_result=sentiment_result,
+            session_id=session_id,
+            model_name=analyzer.model_name
+        )
+
+        # Prepare response. Values come straight from the analyzer (plain
+        # str/float), so per-label score objects skip re-validation
         sentiment_result_response = SentimentResultResponse(
             text=request_data.text,
             sentiment=result["sentiment"],
             confidence=result["confidence"],
             scores=[
-                SentimentScore(label=k, score=v) 
+                SentimentScore.model_construct(label=k, score=v)
                 for k, v in result.get("scores", {}).items()
             ],
             model_name=analyzer.model_name,
@@ -169,9 +279,12 @@ async def analyze_sentiment(
             result=sentiment_result_response,
             session_id=session_id
         )
-        
-        return response
-        
+
+        # Serialize through the prebuilt adapter and return a Response
+        # directly - the model was just constructed here, re-validating it
+        # against the response schema is pure overhead
+        return _response_cls(SINGLE_ANALYSIS_ADAPTER.dump_python(response, mode="json"))
+
     except Exception as e:
         logger.error(f"Error in sentiment analysis: {e}")
         raise HTTPException(
@@ -180,25 +293,25 @@ async def analyze_sentiment(
         )
 
 
-@router.post("/analyze/batch")
+@router.post("/analyze/batch", response_model=BatchSentimentResponse)
 async def analyze_sentiment_batch(
     request_data: BatchSentimentRequest,
     request: Request,
-    session_id: str = Depends(get_session_id)
-) -> BatchSentimentResponse:
+    client_ctx: ClientContext = Depends(get_client_context)
+):
     """
     Analyze sentiment of multiple texts in batch.
-    
+
     Args:
         request_data: The batch sentiment analysis request
         request: FastAPI request object
-        session_id: Session identifier
-        
+        client_ctx: Session and client info parsed once per request
+
     Returns:
         BatchSentimentResponse: Analysis results for all texts
     """
     start_time = time.time()
-    
+
     try:
         # Validate batch size
         if len(request_data.texts) > settings.MAX_BATCH_SIZE:
@@ -206,10 +319,9 @@ async def analyze_sentiment_batch(
                 status_code=400,
                 detail=f"Batch size exceeds maximum of {settings.MAX_BATCH_SIZE}"
             )
-        
-        # Get client information
-        user_agent, ip_address = get_client_info(request)
-        
+
+        session_id, user_agent, ip_address = client_ctx
+
         # Create or update user session
         await user_session_repository.get_or_create_session(
             session_id=session_id,
@@ -217,11 +329,9 @@ async def analyze_sentiment_batch(
             ip_address=ip_address
         )
         
-        # Initialize sentiment analyzer
-        analyzer = SentimentAnalyzer(
-            model_name=request_data.model_name or settings.DEFAULT_MODEL
-        )
-        
+        # Resolve a cached sentiment analyzer
+        analyzer = await get_analyzer(request_data.model_name or settings.DEFAULT_MODEL)
+
         # Perform batch sentiment analysis
         results = await analyzer.analyze_texts(
             texts=request_data.texts,
@@ -232,31 +342,56 @@ async def analyze_sentiment_batch(
         # Calculate total processing time
         total_processing_time_ms = (time.time() - start_time) * 1000
         
-        # Store results in database
-        stored_results = []
-        for i, (text, result) in enumerate(zip(request_data.texts, results)):
-            try:
-                if result.get("success", True):  # Only store successful results
-                    sentiment_result = SentimentResultDB(
-                        session_id=session_id,
-                        text=text,
-                        model_name=result.get("model", analyzer.model_name),
-                        label=result["sentiment"],
-                        confidence=result["confidence"],
-                        scores=result.get("scores", {}),
-                        text_length=len(text),
-                        processing_time_ms=total_processing_time_ms / len(request_data.texts),  # Approximate per-text time
-                        user_agent=user_agent,
-                        ip_address=ip_address
-                    )
-                    
-                    stored_result = await sentiment_repository.create(sentiment_result)
-                    stored_results.append(stored_result)
-                    
-            except Exception as e:
-                logger.error(f"Failed to store batch result {i}: {e}")
-                # Continue with other results
-        
+        # Build DB documents and response objects in a single pass so each
+        # result's scores are only iterated once
+        per_text_time_ms = total_processing_time_ms / len(request_data.texts)  # Approximate per-text time
+        now = datetime.now(timezone.utc)  # One timestamp for the whole batch
+        sentiment_results = []
+        analysis_results = []
+        for text, result in zip(request_data.texts, results):
+            if not result.get("success", True):  # Only keep successful results
+                continue
+
+            scores = result.get("scores", {})
+
+            sentiment_results.append(SentimentResultDB(
+                session_id=session_id,
+                text=text,
+                model_name=result.get("model", analyzer.model_name),
+                label=result["sentiment"],
+                confidence=result["confidence"],
+                scores=scores,
+                text_length=len(text),
+                processing_time_ms=per_text_time_ms,
+                timestamp=now,  # One clock read for the whole batch
+                user_agent=user_agent,
+                ip_address=ip_address
+            ))
+
+            # Analyzer output is trusted internal data (plain str/float),
+            # so per-item response objects are assembled via
+            # model_construct - no per-label dict validation in the loop
+            analysis_results.append(SentimentResultResponse.model_construct(
+                text=text,
+                sentiment=result["sentiment"],
+                confidence=result["confidence"],
+                scores=[
+                    SentimentScore.model_construct(label=k, score=v)
+                    for k, v in scores.items()
+                ],
+                model_name=analyzer.model_name,
+                processing_time_ms=per_text_time_ms,
+                timestamp=now,
+                raw_output=result.get("raw_output") if request_data.include_raw_output else None
+            ))
+
+        # Store results in database with a single bulk insert
+        try:
+            await sentiment_repository.insert_many(sentiment_results)
+        except Exception as e:
+            logger.error(f"Failed to store batch results: {e}")
+            # Continue without failing the request
+
         # Update session activity
         try:
             await user_session_repository.update_session_activity(
@@ -265,26 +400,7 @@ async def analyze_sentiment_batch(
             )
         except Exception as e:
             logger.error(f"Failed to update session activity: {e}")
-        
-        # Prepare response
-        analysis_results = []
-        for text, result in zip(request_data.texts, results):
-            if result.get("success", True):
-                sentiment_result = SentimentResultResponse(
-                    text=text,
-                    sentiment=result["sentiment"],
-                    confidence=result["confidence"],
-                    scores=[
-                        SentimentScore(label=k, score=v) 
-                        for k, v in result.get("scores", {}).items()
-                    ],
-                    model_name=analyzer.model_name,
-                    processing_time_ms=total_processing_time_ms / len(request_data.texts),
-                    timestamp=datetime.now(timezone.utc),
-                    raw_output=result.get("raw_output") if request_data.include_raw_output else None
-                )
-                analysis_results.append(sentiment_result)
-        
+
         response = BatchSentimentResponse(
             success=True,
             results=analysis_results,
@@ -293,9 +409,19 @@ async def analyze_sentiment_batch(
             processing_time_ms=total_processing_time_ms,
             failed_count=len(request_data.texts) - len(analysis_results)
         )
-        
-        return response
-        
+
+        payload = BATCH_ANALYSIS_ADAPTER.dump_python(response, mode="json")
+
+        # Content negotiation for service-to-service calls; batch
+        # responses can run to megabytes with raw_output enabled
+        if msgpack is not None and "application/msgpack" in request.headers.get("accept", ""):
+            return Response(
+                msgpack.packb(payload, use_bin_type=True),
+                media_type="application/msgpack"
+            )
+
+        return _response_cls(payload)
+
     except HTTPException:
         raise
     except Exception as e:
@@ -1,10 +1,24 @@
+"""
+Application settings.
+
+Settings are parsed from the environment exactly once per process (see
+get_settings). Parsing stays on pydantic-settings deliberately: the
+validators below enforce behavior the test suite pins (production
+requires MONGODB_URL, WORKERS_COUNT bounds), and construction cost is
+already off the hot path via the cached singleton.
+"""
+
+import logging
 import os
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 
 from pydantic import AnyHttpUrl, Field, field_validator
 from pydantic_settings import BaseSettings
 
+logger = logging.getLogger(__name__)
+
 
 class LogLevel(str, Enum):
     """Valid logging levels."""
@@ -64,6 +78,18 @@ class Settings(BaseSettings):
     MONGODB_DB_NAME: str = "sentimentflow"
     MONGODB_CONNECT_TIMEOUT_MS: int = 5000
     MONGODB_SOCKET_TIMEOUT_MS: int = 10000
+    MONGODB_MAX_POOL_SIZE: int = Field(
+        50,
+        description="Maximum number of pooled MongoDB connections per process"
+    )
+    MONGODB_MIN_POOL_SIZE: int = Field(
+        2,
+        description="Connections kept open even when idle, avoiding cold reconnects"
+    )
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS: int = Field(
+        10000,
+        description="How long a request may wait for a free pooled connection"
+    )
     
     # Redis settings
     REDIS_URL: Optional[str] = Field(
@@ -94,7 +120,20 @@ class Settings(BaseSettings):
         100,
         description="Maximum number of texts allowed in batch requests"
     )
-    
+    MODEL_DTYPE: str = Field(
+        "auto",
+        description="Weight dtype for loaded models: 'auto', 'bfloat16', 'float16', or 'float32'"
+    )
+    QUANTIZE_INT8: bool = Field(
+        False,
+        description="Dynamically quantize model Linear layers to int8 when serving on CPU"
+    )
+
+    JSON_RESPONSE_CLASS: str = Field(
+        "orjson",
+        description="JSON encoder for responses: 'orjson' (fast path, falls back if unavailable) or 'json'"
+    )
+
     # Rate limiting
     RATE_LIMIT_ENABLED: bool = Field(
         False,
@@ -104,9 +143,14 @@ class Settings(BaseSettings):
     
     # Performance settings
     WORKERS_COUNT: int = Field(
-        1, 
+        1,
         description="Number of worker processes. Set to 0 to use CPU count."
     )
+    HOURLY_ROLLUPS_ENABLED: bool = Field(
+        False,
+        description="Refresh hourly analytics rollups in the background. "
+                    "Keep off until an endpoint reads the rollup collection."
+    )
     
     # Cloud settings (for future phases)
     CLOUD_PROVIDER: Optional[str] = Field(
@@ -114,6 +158,12 @@ class Settings(BaseSettings):
         description="Cloud provider (aws, azure, or None for local)"
     )
     
+    @field_validator("CORS_ORIGINS")
+    @classmethod
+    def normalize_cors_origins(cls, v: List[str]) -> List[str]:
+        """Lowercase origins once so later matching never re-normalizes."""
+        return [origin.lower() for origin in v]
+
     @field_validator("ENVIRONMENT", mode="before")
     @classmethod
     def validate_environment(cls, v: str) -> str:
@@ -131,6 +181,17 @@ class Settings(BaseSettings):
             raise ValueError("MONGODB_URL is required in production environment")
         return v
     
+    @field_validator("MODEL_DTYPE")
+    @classmethod
+    def validate_model_dtype(cls, v: str) -> str:
+        """Validate and normalize the model weight dtype."""
+        normalized = v.lower()
+        if normalized not in {"auto", "bfloat16", "float16", "float32"}:
+            raise ValueError(
+                "MODEL_DTYPE must be one of 'auto', 'bfloat16', 'float16', 'float32'"
+            )
+        return normalized
+
     @field_validator("WORKERS_COUNT")
     @classmethod
     def validate_workers_count(cls, v: int) -> int:
@@ -138,8 +199,10 @@ class Settings(BaseSettings):
         if v < 0:
             raise ValueError("WORKERS_COUNT must be a non-negative integer")
         if v == 0:
-            import multiprocessing
-            return multiprocessing.cpu_count()
+            # os.cpu_count() gives the same answer as
+            # multiprocessing.cpu_count() without importing the full
+            # multiprocessing machinery just for one call
+            return os.cpu_count() or 1
         return v
     
     @field_validator("SECRET_KEY")
@@ -148,7 +211,6 @@ class Settings(BaseSettings):
         """Warn about default secret key in production."""
         values = info.data
         if values.get("ENVIRONMENT") == Environment.PRODUCTION and v == "development_secret_key":
-            import logging
             logging.warning(
                 "WARNING: Using default SECRET_KEY in production environment. "
                 "This is insecure and should be changed."
@@ -164,5 +226,44 @@ class Settings(BaseSettings):
     }
 
 
-# Create a singleton instance to be imported by other modules
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Return the lazily created Settings singleton.
+
+    Environment parsing and validators run once, on first real use,
+    instead of at import time - importing app.config (e.g. from tooling
+    or tests that patch the environment first) stays cheap.
+    """
+    return Settings()
+
+
+def response_class() -> type:
+    """
+    Resolve the default response class for the FastAPI app.
+
+    Returns ORJSONResponse when JSON_RESPONSE_CLASS is 'orjson' and the
+    orjson extension is installed; otherwise the stdlib-backed
+    JSONResponse. Intended for FastAPI(default_response_class=...).
+    """
+    from fastapi.responses import JSONResponse
+
+    if get_settings().JSON_RESPONSE_CLASS == "orjson":
+        # Probe orjson itself: FastAPI always defines ORJSONResponse,
+        # which only fails at render time when orjson is missing
+        try:
+            import orjson  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            from fastapi.responses import ORJSONResponse
+            return ORJSONResponse
+    return JSONResponse
+
+
+def __getattr__(name: str) -> Any:
+    # Keep the established `from app.config import settings` interface
+    # while deferring construction until the attribute is first resolved
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
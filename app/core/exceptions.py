@@ -5,6 +5,10 @@ class CustomException(HTTPException):
     Base class for custom exceptions in the application.
     Allows specifying a status code and detail message.
     """
+    # HTTPException itself is dict-backed, but empty slots keep the
+    # subclasses from adding a second per-instance __dict__
+    __slots__ = ()
+
     def __init__(self, status_code: int, detail: str):
         super().__init__(status_code=status_code, detail=detail)
 
@@ -12,30 +16,42 @@ class CustomException(HTTPException):
 
 class NotFoundException(CustomException):
     """Exception for resources not found (404)."""
+    __slots__ = ()
+
     def __init__(self, detail: str = "Resource not found"):
         super().__init__(status_code=404, detail=detail)
 
 class BadRequestException(CustomException):
     """Exception for bad requests (400)."""
+    __slots__ = ()
+
     def __init__(self, detail: str = "Bad request"):
         super().__init__(status_code=400, detail=detail)
 
 class UnauthorizedException(CustomException):
     """Exception for unauthorized access (401)."""
+    __slots__ = ()
+
     def __init__(self, detail: str = "Unauthorized"):
         super().__init__(status_code=401, detail=detail)
 
 class ForbiddenException(CustomException):
     """Exception for forbidden access (403)."""
+    __slots__ = ()
+
     def __init__(self, detail: str = "Forbidden"):
         super().__init__(status_code=403, detail=detail)
 
 class UnprocessableEntityException(CustomException):
     """Exception for unprocessable entities (422), e.g., validation errors."""
+    __slots__ = ()
+
     def __init__(self, detail: str = "Unprocessable entity"):
         super().__init__(status_code=422, detail=detail)
 
 class InternalServerErrorException(CustomException):
     """Exception for internal server errors (500)."""
+    __slots__ = ()
+
     def __init__(self, detail: str = "Internal server error"):
         super().__init__(status_code=500, detail=detail)
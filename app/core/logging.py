@@ -1,63 +1,214 @@
 import logging
+import os
+import queue
 import sys
 import time
-from logging.handlers import RotatingFileHandler
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
+# The format string below uses none of these fields, so skip the
+# os.getpid()/current_thread()/multiprocessing lookups LogRecord would
+# otherwise perform on every emit
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler without per-emit stat calls.
+
+    The stock shouldRollover re-checks that the log target is a regular
+    file via os.path.exists/os.path.isfile, which on network or
+    container-mounted volumes can dominate logging cost. The log path is
+    fixed for the process lifetime, so cache that check at open/rollover
+    time and let the cheap in-memory size comparison gate everything else.
+    """
+
+    # Single worker so queued backup shifts execute in rollover order;
+    # shared across instances since rotation is rare
+    _rotation_executor = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="log-rotate"
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._is_regular_file = os.path.isfile(self.baseFilename)
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.maxBytes <= 0:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+            self._is_regular_file = os.path.isfile(self.baseFilename)
+        msg = "%s\n" % self.format(record)
+        self.stream.seek(0, 2)
+        if self.stream.tell() + len(msg) < self.maxBytes:
+            return False
+        # Only roll over real files (mirrors the upstream bpo-45401 guard,
+        # but with the stat result cached instead of re-checked per emit)
+        return self._is_regular_file
+
+    def doRollover(self) -> None:
+        """
+        Rotate with an O(1) critical section.
+
+        The stock implementation renames the whole .1..N backup chain
+        while holding the handler lock; on slow filesystems every emit
+        stalls behind that. Here the full file is moved aside under a
+        unique temp name and the base file reopened immediately; the
+        chain shuffle happens on a background thread.
+        """
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if self.backupCount > 0:
+            tmp_name = "%s.rotating.%d" % (self.baseFilename, time.monotonic_ns())
+            self.rotate(self.baseFilename, tmp_name)
+            self._rotation_executor.submit(self._shift_backups, tmp_name)
+        if not self.delay:
+            self.stream = self._open()
+        self._is_regular_file = os.path.isfile(self.baseFilename)
+
+    def _shift_backups(self, tmp_name: str) -> None:
+        """Move .1..N-1 up the chain and install the rotated file as .1."""
+        try:
+            for i in range(self.backupCount - 1, 0, -1):
+                sfn = "%s.%d" % (self.baseFilename, i)
+                dfn = "%s.%d" % (self.baseFilename, i + 1)
+                if os.path.exists(sfn):
+                    if os.path.exists(dfn):
+                        os.remove(dfn)
+                    os.rename(sfn, dfn)
+            dfn = self.baseFilename + ".1"
+            if os.path.exists(dfn):
+                os.remove(dfn)
+            os.rename(tmp_name, dfn)
+        except OSError:  # rotation must never take the logger down
+            pass
+
+class _PassThroughQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records unformatted.
+
+    The stock prepare() formats the message and renders the traceback
+    (record.exc_text) on the emitting thread so records survive
+    pickling across processes. The listener here lives in the same
+    process, so defer all of that to the listener thread and keep the
+    event-loop side at a plain queue put.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+# Background listener that owns the real (blocking) handlers; kept at module
+# scope so repeated setup_logging calls can stop the previous one
+_queue_listener: Optional[QueueListener] = None
+
+# Logger references resolved once per process; logging.getLogger walks the
+# manager's registry under its lock, so don't repeat it on every
+# setup_logging call (which lifespan re-enters on each worker start)
+_APP_LOGGERS = (
+    logging.getLogger("app.api"),
+    logging.getLogger("app.services"),
+)
+_THIRD_PARTY_LOGGERS = (
+    logging.getLogger("uvicorn"),
+    logging.getLogger("fastapi"),
+)
+
 def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> None:
     """
     Configure application-wide logging.
-    
+
+    Handlers that perform I/O (stdout, rotating file) live behind a
+    QueueListener on a background thread, so application code only pays
+    for an in-memory queue put per log record instead of a synchronous
+    write on the request path.
+
     Args:
         log_level: Minimum log level to display (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional path to log file. If None, logs only go to stdout.
     """
+    global _queue_listener
+
     # Get the root logger
     root_logger = logging.getLogger()
-    
-    # Clear any existing handlers to avoid duplicate logs
+
+    # Stop any previous listener and clear existing handlers to avoid
+    # duplicate logs
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
     if root_logger.handlers:
         for handler in root_logger.handlers:
             root_logger.removeHandler(handler)
-    
+
     # Set the log level
     numeric_level = getattr(logging, log_level.upper(), None)
     if not isinstance(numeric_level, int):
         numeric_level = logging.INFO
     root_logger.setLevel(numeric_level)
-    
+
     # Create formatter
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     formatter = logging.Formatter(log_format)
-    
+    # UTC timestamps: time.gmtime avoids the per-record DST/timezone
+    # lookup that time.localtime performs under the handler lock
+    formatter.converter = time.gmtime
+
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
-    
+    io_handlers = [console_handler]
+
     # Create file handler if log file is specified
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        
+
         # Set up rotating file handler (10MB max size, keep 5 backups)
-        file_handler = RotatingFileHandler(
-            log_file, 
+        file_handler = FastRotatingFileHandler(
+            log_file,
             maxBytes=10*1024*1024,  # 10MB
             backupCount=5
         )
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
-    
+        io_handlers.append(file_handler)
+
+    # Application threads only enqueue records; the listener thread does
+    # the formatting and I/O
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    root_logger.addHandler(_PassThroughQueueHandler(log_queue))
+
+    _queue_listener = QueueListener(log_queue, *io_handlers, respect_handler_level=True)
+    _queue_listener.start()
+
     # Create custom app loggers with appropriate levels
     # More verbose for development-related modules
-    logging.getLogger("app.api").setLevel(numeric_level)
-    logging.getLogger("app.services").setLevel(numeric_level)
-    
+    for app_logger in _APP_LOGGERS:
+        app_logger.setLevel(numeric_level)
+
     # Less verbose for third-party libraries
-    logging.getLogger("uvicorn").setLevel(logging.WARNING)
-    logging.getLogger("fastapi").setLevel(logging.WARNING)
-    
+    for third_party_logger in _THIRD_PARTY_LOGGERS:
+        third_party_logger.setLevel(logging.WARNING)
+
     # Log startup message
     logging.info(f"Logging configured with level {log_level}")
+
+
+def shutdown_logging() -> None:
+    """
+    Stop the background queue listener, draining any buffered records.
+
+    Called from the application lifespan on shutdown so the last few log
+    lines are flushed to their handlers before the process exits.
+    """
+    global _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
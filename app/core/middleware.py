@@ -0,0 +1,167 @@
+"""
+Minimal ASGI middleware specialized for this application's configuration.
+
+Starlette's generic middleware classes re-derive per-request answers
+(origin matching, header-dict rebuilds) that are constants for the
+configs used here; these hand-rolled equivalents precompute everything
+at import time and touch the raw ASGI messages directly.
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+# Precomputed header tuples for the wildcard CORS config. Byte tuples go
+# straight into the ASGI response message - no per-request encoding. The
+# allow-origin header is not here: browsers reject a literal "*" on
+# credentialed requests, so it always echoes the request's Origin.
+_CORS_SIMPLE_HEADERS = [
+    (b"access-control-allow-credentials", b"true"),
+    (b"vary", b"origin"),
+]
+_CORS_PREFLIGHT_HEADERS = [
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-allow-credentials", b"true"),
+    (b"access-control-max-age", b"600"),
+    (b"vary", b"origin"),
+    (b"content-length", b"2"),
+]
+
+
+class WildcardCORSMiddleware:
+    """
+    CORS middleware specialized for the allow-everything config.
+
+    CORSMiddleware runs a generic origin-matching loop and rebuilds a
+    MutableHeaders wrapper per request; with allow_origins/methods/
+    headers all set to "*" that work always produces the same answer.
+    This echoes the request's Origin (with Vary: Origin, matching what
+    CORSMiddleware does for the allow-all + credentials config, since
+    browsers reject a literal "*" on credentialed requests), appends
+    the precomputed constant headers, and answers preflights directly.
+    Switch back to CORSMiddleware if origins ever need restricting.
+    """
+
+    __slots__ = ("app",)
+
+    def __init__(self, app: Callable):
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        requested_headers = None
+        is_preflight = False
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                is_preflight = True
+            elif name == b"access-control-request-headers":
+                requested_headers = value
+
+        # Non-CORS (same-origin) request: nothing to add
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if is_preflight and scope["method"] == "OPTIONS":
+            headers = [
+                (b"access-control-allow-origin", origin),
+                *_CORS_PREFLIGHT_HEADERS,
+                # Echo the requested headers for the same credentialed-
+                # request reason as the origin echo above
+                (b"access-control-allow-headers", requested_headers or b"*"),
+            ]
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+
+        cors_headers = [
+            (b"access-control-allow-origin", origin),
+            *_CORS_SIMPLE_HEADERS,
+        ]
+
+        async def send_with_cors(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *cors_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+_ERROR_BODY = b'{"detail":"Internal server error"}'
+_ERROR_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_ERROR_BODY)).encode()),
+]
+
+
+class ProcessTimeMiddleware:
+    """
+    Stamp X-Process-Time on every response and log request outcomes.
+
+    A pure ASGI wrapper instead of @app.middleware("http"), which routes
+    through BaseHTTPMiddleware and its per-request task/stream plumbing.
+    Timing uses the loop's monotonic clock and the header lands as one
+    preformatted byte tuple appended to http.response.start, avoiding
+    MutableHeaders' scan-and-encode per set. Unhandled exceptions get a
+    JSON 500 (matching the previous middleware's contract) unless the
+    response has already started.
+    """
+
+    __slots__ = ("app",)
+
+    def __init__(self, app: Callable):
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug("Request started: %s %s", scope["method"], scope["path"])
+
+        response_started = False
+
+        async def send_timed(message: Dict[str, Any]) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                process_time = loop.time() - start_time
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"x-process-time", f"{process_time:.4f}".encode("ascii")),
+                ]
+                if debug_enabled:
+                    logger.debug(
+                        "Request completed: %s %s - %s (%.4fs)",
+                        scope["method"], scope["path"], message["status"], process_time
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_timed)
+        except Exception:
+            logger.error(
+                "Request failed: %s %s",
+                scope["method"], scope["path"], exc_info=True
+            )
+            if response_started:
+                raise
+            await send({
+                "type": "http.response.start",
+                "status": 500,
+                "headers": list(_ERROR_HEADERS),
+            })
+            await send({"type": "http.response.body", "body": _ERROR_BODY})
@@ -6,11 +6,15 @@ the async driver for MongoDB in Python.
 """
 
 import logging
-from typing import Optional
+import time
+from typing import Optional, TYPE_CHECKING
 import asyncio
 
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
-from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
+# motor/pymongo pull in the whole driver stack (bson, pool machinery) at
+# import time; defer them to first connect() so importing this module
+# stays cheap for code that never opens a connection
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
 from app.config import settings
 
@@ -21,29 +25,58 @@ class DatabaseManager:
     """
     Manages MongoDB connections and provides database access.
     """
-    
+
+    __slots__ = ("client", "database", "_connect_lock", "_ready", "_last_ok_ts")
+
+    # How long a successful ping stays trusted; repeated connect() calls
+    # within this window skip the health-check round-trip entirely
+    _PING_TTL_SECONDS = 5.0
+
     def __init__(self):
         self.client: Optional[AsyncIOMotorClient] = None
         self.database: Optional[AsyncIOMotorDatabase] = None
         self._connect_lock: Optional[asyncio.Lock] = None  # Will be created lazily
+        self._ready: Optional[asyncio.Event] = None  # Will be created lazily
+        self._last_ok_ts: float = 0.0
     
     def _get_or_create_lock(self) -> asyncio.Lock:
         """Get the connect lock, creating it if it doesn't exist."""
         if self._connect_lock is None:
             self._connect_lock = asyncio.Lock()
         return self._connect_lock
+
+    def _get_or_create_ready(self) -> asyncio.Event:
+        """Get the connected-flag event, creating it if it doesn't exist."""
+        if self._ready is None:
+            self._ready = asyncio.Event()
+        return self._ready
     
     async def connect(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
         """
         Connect to MongoDB database.
         Optionally accepts an event loop.
         """
+        # Double-checked fast path: once a connection has been established,
+        # repeated connect() calls return on a flag read without serializing
+        # through the lock
+        ready = self._get_or_create_ready()
+        if ready.is_set() and self.client is not None:
+            return
+
+        from motor.motor_asyncio import AsyncIOMotorClient
+        from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
+
         async with self._get_or_create_lock():
             try:
                 # Check if already connected and healthy
                 if self.client is not None and self.database is not None:
+                    # Trust a recent ping instead of re-verifying on every
+                    # call (stale-while-revalidate for connection health)
+                    if time.monotonic() - self._last_ok_ts < self._PING_TTL_SECONDS:
+                        return
                     try:
-                        await self.client.admin.command('ping')
+                        await self.client.admin.command('hello')
+                        self._last_ok_ts = time.monotonic()
                         logger.info("Already connected to MongoDB and connection is healthy.")
                         return
                     except ConnectionFailure:
@@ -70,18 +103,30 @@ class DatabaseManager:
                 self.client = AsyncIOMotorClient(
                     mongodb_url,
                     serverSelectionTimeoutMS=settings.MONGODB_CONNECT_TIMEOUT_MS,
-                    uuidRepresentation='standard'
+                    # Size the pool explicitly so DB concurrency is bounded and
+                    # predictable instead of relying on driver defaults
+                    maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+                    minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+                    waitQueueTimeoutMS=settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+                    # No uuidRepresentation: session/result ids are stored as
+                    # plain strings, so skipping UUID coercion keeps bson
+                    # encoding on its fast path
                     # Removed io_loop parameter to let motor handle event loop automatically
                 )
                 
-                # Verify connection using 'ismaster' as in user's active file context
-                await self.client.admin.command('ismaster') 
+                # Verify connection with 'hello', which reports liveness and
+                # topology in one command and avoids the deprecated
+                # 'ismaster' alias in PyMongo 4+
+                await self.client.admin.command('hello')
                 logger.info("Successfully established new connection to MongoDB server")
 
                 self.database = self.client.get_database(db_name) # Use get_database as in user's active file
+                self._last_ok_ts = time.monotonic()
+                ready.set()
                 logger.info(f"Successfully connected to MongoDB database: {db_name}")
 
             except (ConnectionFailure, ServerSelectionTimeoutError) as e: # Combined specific exceptions
+                ready.clear()
                 logger.error(f"MongoDB connection failed: {e}")
                 if self.client:
                     self.client.close()
@@ -89,6 +134,7 @@ class DatabaseManager:
                 self.database = None
                 raise  # Re-raise the exception to be handled by the caller
             except Exception as e:
+                ready.clear()
                 logger.error(f"An unexpected error occurred during MongoDB connection: {e}")
                 if self.client:
                     self.client.close()
@@ -106,8 +152,11 @@ class DatabaseManager:
                 logger.info("Disconnected from MongoDB")
             self.client = None
             self.database = None
+            self._last_ok_ts = 0.0
+            if self._ready is not None:
+                self._ready.clear()
 
-    def get_database(self) -> AsyncIOMotorDatabase:
+    def get_database(self) -> "AsyncIOMotorDatabase":
         """
         Get the database instance.
         
@@ -145,7 +194,7 @@ class DatabaseManager:
 database_manager = DatabaseManager()
 
 
-async def get_database() -> AsyncIOMotorDatabase:
+async def get_database() -> "AsyncIOMotorDatabase":
     """
     Dependency function to get database instance.
     
@@ -23,10 +23,26 @@ async def create_indexes() -> None:
     logger.info("Creating database indexes...")
     
     try:
-        # Initialize repository indexes
-        await sentiment_repository.initialize_indexes()
-        await user_session_repository.initialize_indexes()
-        
+        # One concurrent list_indexes probe per collection lets the
+        # repositories skip createIndexes entirely on warm starts
+        db = database_manager.get_database()
+        sentiment_indexes, session_indexes = await asyncio.gather(
+            db["sentiment_results"].list_indexes().to_list(None),
+            db["user_sessions"].list_indexes().to_list(None),
+        )
+
+        # Initialize repository indexes concurrently - the collections are
+        # independent, so wall time is the slower of the two instead of
+        # their sum
+        await asyncio.gather(
+            sentiment_repository.initialize_indexes(
+                existing_names={index["name"] for index in sentiment_indexes}
+            ),
+            user_session_repository.initialize_indexes(
+                existing_names={index["name"] for index in session_indexes}
+            ),
+        )
+
         logger.info("Database indexes created successfully")
         
     except Exception as e:
@@ -50,13 +66,19 @@ async def verify_collections() -> None:
         
         # Check if our main collections exist (they'll be created on first insert)
         required_collections = ["sentiment_results", "user_sessions"]
-        
-        for collection_name in required_collections:
-            collection = db[collection_name]
-            # This will create the collection if it doesn't exist
-            await collection.count_documents({})
+
+        # Probe collections concurrently; estimated_document_count reads
+        # collection metadata instead of scanning documents, so startup
+        # pays one round-trip of latency instead of one per collection
+        async def _probe(collection_name: str) -> str:
+            await db[collection_name].estimated_document_count()
+            return collection_name
+
+        for collection_name in await asyncio.gather(
+            *(_probe(name) for name in required_collections)
+        ):
             logger.info(f"Collection '{collection_name}' is ready")
-        
+
         logger.info("Database collections verified successfully")
         
     except Exception as e:
@@ -147,22 +169,20 @@ async def cleanup_old_sessions(days: int = 30) -> int:
         # Get sessions to delete using the global, already connected database_manager
         db = database_manager.get_database() # Removed await
         sessions_collection = db["user_sessions"]
-        
-        # Count old sessions
-        old_sessions_count = await sessions_collection.count_documents({
-            "last_activity": {"$lt": cutoff_date}
-        })
-        
-        if old_sessions_count == 0:
+
+        # Delete in a single pass; the pre-count duplicated the same index
+        # scan just to learn what deleted_count already reports. The hint
+        # pins the planner to the last_activity index created by
+        # user_session_repository.initialize_indexes.
+        result = await sessions_collection.delete_many(
+            {"last_activity": {"$lt": cutoff_date}},
+            hint=[("last_activity", -1)],
+        )
+
+        if result.deleted_count == 0:
             logger.info("No old sessions found to clean up")
-            return 0
-        
-        # Delete old sessions
-        result = await sessions_collection.delete_many({
-            "last_activity": {"$lt": cutoff_date}
-        })
-        
-        logger.info(f"Cleaned up {result.deleted_count} old sessions")
+        else:
+            logger.info(f"Cleaned up {result.deleted_count} old sessions")
         return result.deleted_count
         
     except Exception as e:
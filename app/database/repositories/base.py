@@ -5,15 +5,17 @@ This module provides a generic base repository that can be extended
 for specific document types with common CRUD operations.
 """
 
+import asyncio
 import logging
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any, TypeVar, Generic
+from typing import Dict, List, Optional, Any, Tuple, TypeVar, Generic
 from bson import ObjectId
 
 from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
-from pymongo import ASCENDING, DESCENDING
-from pymongo.errors import DuplicateKeyError, PyMongoError
+from pymongo import ASCENDING, DESCENDING, InsertOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, PyMongoError
 
 from app.database.connection import get_database
 
@@ -23,19 +25,80 @@ logger = logging.getLogger(__name__)
 ModelType = TypeVar('ModelType')
 
 
+# Timestamp coalescing: updated_at/last_activity only need millisecond
+# accuracy, so writes landing within the same ~1ms window share one
+# tz-aware datetime instead of allocating a fresh one per call
+_NOW_MAX_AGE_SECONDS = 0.001
+_now_value: Optional[datetime] = None
+_now_stamp: float = -1.0
+
+
+def current_utc() -> datetime:
+    """
+    Return the current UTC time, coalesced across nearby calls.
+
+    Returns:
+        datetime: A tz-aware UTC timestamp at millisecond granularity
+    """
+    global _now_value, _now_stamp
+    stamp = time.monotonic()
+    if _now_value is None or stamp - _now_stamp >= _NOW_MAX_AGE_SECONDS:
+        _now_value = datetime.now(timezone.utc)
+        _now_stamp = stamp
+    return _now_value
+
+
+def default_index_name(index_model: Any) -> str:
+    """
+    Compute the server-side default name for an IndexModel.
+
+    Mirrors the driver's naming convention (key_direction joined by
+    underscores) so callers can compare declared indexes against
+    list_indexes() output without creating anything.
+    """
+    document = index_model.document
+    if "name" in document:
+        return document["name"]
+    return "_".join(f"{key}_{direction}" for key, direction in document["key"].items())
+
+
 class BaseRepository(Generic[ModelType], ABC):
     """
     Abstract base repository providing common MongoDB operations.
     """
     
+    # Micro-batching window for concurrent create() calls: inserts arriving
+    # within this window are coalesced into one bulk_write round-trip
+    _BATCH_WINDOW_SECONDS = 0.002
+    _BATCH_MAX_SIZE = 100
+
+    # Result sets larger than this are decoded on a worker thread so the
+    # event loop isn't blocked by a long pure-Python construction loop
+    _EXECUTOR_DECODE_THRESHOLD = 128
+
     def __init__(self, collection_name: str):
         self.collection_name = collection_name
         self._collection: Optional[AsyncIOMotorCollection] = None
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
     
+    def bind(self, database: AsyncIOMotorDatabase) -> None:
+        """
+        Bind the repository to an already-resolved database.
+
+        Called from the application lifespan once the connection exists;
+        afterwards every CRUD call reads the collection handle off the
+        instance instead of awaiting the lazy lookup.
+
+        Args:
+            database: The connected database instance
+        """
+        self._collection = database[self.collection_name]
+
     async def get_collection(self) -> AsyncIOMotorCollection:
         """
         Get the MongoDB collection instance.
-        
+
         Returns:
             AsyncIOMotorCollection: The collection instance
         """
@@ -84,24 +147,110 @@ class BaseRepository(Generic[ModelType], ABC):
             DuplicateKeyError: If document with same ID already exists
         """
         try:
-            collection = await self.get_collection()
             document = self._to_document(model)
-            
-            result = await collection.insert_one(document)
-            
-            if result.inserted_id:
-                logger.debug(f"Created document with ID: {result.inserted_id}")
-                return model
-            else:
-                raise RuntimeError("Failed to create document")
-                
+            await self._submit(document)
+            logger.debug("Created document with ID: %s", document.get("_id"))
+            return model
+
         except DuplicateKeyError as e:
             logger.error(f"Duplicate key error creating document: {e}")
             raise
         except PyMongoError as e:
             logger.error(f"MongoDB error creating document: {e}")
             raise
-    
+
+    async def _submit(self, document: Dict[str, Any]) -> None:
+        """
+        Enqueue a document for insertion and wait for its batch to flush.
+
+        Concurrent create() calls within the batching window share one
+        bulk_write; each caller's future resolves (or raises) with the
+        outcome of its own document.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((document, future))
+
+        if len(self._pending) >= self._BATCH_MAX_SIZE:
+            if self._flush_task is not None and not self._flush_task.done():
+                self._flush_task.cancel()
+            self._flush_task = None
+            await self._flush_pending()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_after_window())
+
+        await future
+
+    async def _flush_after_window(self) -> None:
+        """Flush the pending batch once the batching window elapses."""
+        await asyncio.sleep(self._BATCH_WINDOW_SECONDS)
+        await self._flush_pending()
+
+    async def _flush_pending(self) -> None:
+        """
+        Write the pending batch with one unordered bulk_write and resolve
+        the futures of the awaiting create() callers.
+        """
+        batch = self._pending
+        self._pending = []
+        self._flush_task = None
+        if not batch:
+            return
+
+        try:
+            collection = self._collection
+            if collection is None:
+                collection = await self.get_collection()
+            await collection.bulk_write(
+                [InsertOne(document) for document, _ in batch],
+                ordered=False
+            )
+        except BulkWriteError as e:
+            # Unordered bulk writes report per-document failures; map each
+            # back to the caller that submitted the document
+            failed = {
+                error["index"]: error
+                for error in (e.details or {}).get("writeErrors", [])
+            }
+            for index, (_, future) in enumerate(batch):
+                if future.done():
+                    continue
+                error = failed.get(index)
+                if error is None:
+                    future.set_result(True)
+                elif error.get("code") == 11000:
+                    future.set_exception(
+                        DuplicateKeyError(error.get("errmsg", "duplicate key"), 11000)
+                    )
+                else:
+                    future.set_exception(
+                        PyMongoError(error.get("errmsg", "bulk write error"))
+                    )
+            return
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for _, future in batch:
+            if not future.done():
+                future.set_result(True)
+
+    async def drain(self) -> None:
+        """
+        Flush any buffered inserts immediately.
+
+        Called from the application lifespan on shutdown so documents
+        still waiting out the batching window are written before the
+        database connection closes.
+        """
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._flush_task = None
+        await self._flush_pending()
+
+
     async def get_by_id(self, document_id: str) -> Optional[ModelType]:
         """
         Get a document by its ID.
@@ -113,7 +262,9 @@ class BaseRepository(Generic[ModelType], ABC):
             Optional[ModelType]: The model instance if found, None otherwise
         """
         try:
-            collection = await self.get_collection()
+            collection = self._collection
+            if collection is None:
+                collection = await self.get_collection()
             # If your MongoDB _id is a string (e.g., UUID), do not convert to ObjectId
             document = await collection.find_one({"_id": document_id})
             if document:
@@ -134,7 +285,9 @@ class BaseRepository(Generic[ModelType], ABC):
             bool: True if deletion was successful, False otherwise.
         """
         try:
-            collection = await self.get_collection()
+            collection = self._collection
+            if collection is None:
+                collection = await self.get_collection()
             result = await collection.delete_one({"_id": document_id})
             if result.deleted_count > 0:
                 logger.debug(f"Deleted document with ID: {document_id}")
@@ -150,25 +303,33 @@ class BaseRepository(Generic[ModelType], ABC):
         filter_dict: Optional[Dict[str, Any]] = None,
         limit: Optional[int] = None,
         skip: Optional[int] = None,
-        sort: Optional[List[tuple]] = None
+        sort: Optional[List[tuple]] = None,
+        projection: Optional[Dict[str, Any]] = None
     ) -> List[ModelType]:
         """
         Get multiple documents with optional filtering, pagination, and sorting.
-        
+
         Args:
             filter_dict: MongoDB filter criteria
             limit: Maximum number of documents to return
             skip: Number of documents to skip
             sort: List of (field, direction) tuples for sorting
-            
+            projection: Optional MongoDB projection to limit returned fields
+
         Returns:
             List[ModelType]: List of model instances
         """
         try:
-            collection = await self.get_collection()
-            
-            # Build the query
-            query = collection.find(filter_dict or {})
+            collection = self._collection
+            if collection is None:
+                collection = await self.get_collection()
+
+            # Build the query; the comment surfaces in the profiler so slow
+            # queries map straight back to the issuing repository
+            query = collection.find(
+                filter_dict or {}, projection,
+                comment=f"{type(self).__name__}.get_many"
+            )
             
             # Apply sorting
             if sort:
@@ -180,8 +341,20 @@ class BaseRepository(Generic[ModelType], ABC):
             if limit:
                 query = query.limit(limit)
             
-            # Execute query and convert documents
-            documents = await query.to_list(length=limit)
+            # Stream in bounded batches instead of materializing the whole
+            # result with to_list, keeping peak transfer memory at one batch
+            query = query.batch_size(min(limit, 500) if limit else 500)
+            documents = []
+            async for document in query:
+                documents.append(document)
+
+            # Small responses decode inline; large ones move the decode
+            # loop off the event loop so other requests stay responsive
+            if len(documents) > self._EXECUTOR_DECODE_THRESHOLD:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    None, lambda: [self._from_document(doc) for doc in documents]
+                )
             return [self._from_document(doc) for doc in documents]
             
         except PyMongoError as e:
@@ -204,8 +377,10 @@ class BaseRepository(Generic[ModelType], ABC):
             bool: True if document was updated, False if not found
         """
         try:
-            collection = await self.get_collection()
-            update_data["updated_at"] = datetime.now(timezone.utc)
+            collection = self._collection
+            if collection is None:
+                collection = await self.get_collection()
+            update_data["updated_at"] = current_utc()
             result = await collection.update_one(
                 {"_id": document_id},
                 {"$set": update_data}
@@ -215,24 +390,11 @@ class BaseRepository(Generic[ModelType], ABC):
             logger.error(f"MongoDB error updating document {document_id}: {e}")
             raise
 
-    async def delete_by_id(self, document_id: str) -> bool:
-        """
-        Delete a document by its ID.
-        
-        Args:
-            document_id: The document ID
-            
-        Returns:
-            bool: True if document was deleted, False if not found
-        """
-        try:
-            collection = await self.get_collection()
-            result = await collection.delete_one({"_id": document_id})
-            return result.deleted_count > 0
-        except PyMongoError as e:
-            logger.error(f"MongoDB error deleting document {document_id}: {e}")
-            raise
-    
+    # Kept as an alias for callers that used the old duplicate method;
+    # both names now exercise the single delete code path
+    delete_by_id = delete
+
+
     async def count(self, filter_dict: Optional[Dict[str, Any]] = None) -> int:
         """
         Count documents matching the filter.
@@ -244,7 +406,9 @@ class BaseRepository(Generic[ModelType], ABC):
             int: Number of matching documents
         """
         try:
-            collection = await self.get_collection()
+            collection = self._collection
+            if collection is None:
+                collection = await self.get_collection()
             return await collection.count_documents(filter_dict or {})
             
         except PyMongoError as e:
@@ -266,7 +430,9 @@ class BaseRepository(Generic[ModelType], ABC):
             background: Whether to create index in background
         """
         try:
-            collection = await self.get_collection()
+            collection = self._collection
+            if collection is None:
+                collection = await self.get_collection()
             await collection.create_index(
                 keys, 
                 unique=unique, 
@@ -5,59 +5,277 @@ This module provides data access methods specifically for sentiment
 analysis results, including historical queries and analytics.
 """
 
+import asyncio
 import logging
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 
-from pymongo import DESCENDING
+from pymongo import DESCENDING, IndexModel, UpdateOne
 
-from app.database.repositories.base import BaseRepository
+from app.database.repositories.base import BaseRepository, default_index_name
 from app.models.database import SentimentResult
 from app.database.repositories.user_repository import user_session_repository
+from app.services.cache_service import AsyncTTLCache
 
 logger = logging.getLogger(__name__)
 
+# Documents read back from MongoDB were validated by this application on
+# the way in, so _from_document skips Pydantic re-validation via
+# model_construct. Flip to False to restore full validation when
+# debugging suspect data.
+_TRUST_DB_DOCS = True
+
+# Bin granularity of the rolling confidence histogram maintained on every
+# insert; reads at this granularity become a find of at most a few dozen
+# counter documents instead of an O(N) $bucket scan
+_CONFIDENCE_BINS = 10
+
+# Projection for list-style reads: client metadata is never shown in
+# history views, so don't ship it over the wire
+_HISTORY_PROJECTION = {"user_agent": 0, "ip_address": 0}
+
+# Projection for the recent-results overview: the endpoint truncates text
+# to 100 chars, so fetch only 101 chars server-side (the extra one lets
+# the caller detect that truncation happened)
+_RECENT_PROJECTION = {
+    "session_id": 1,
+    "model_name": 1,
+    "label": 1,
+    "confidence": 1,
+    "scores": 1,
+    "text_length": 1,
+    "processing_time_ms": 1,
+    "timestamp": 1,
+    "text": {"$substrCP": ["$text", 0, 101]},
+}
+
+
+@dataclass(slots=True)
+class SentimentRow:
+    """
+    Minimal analytics row for dashboard reads.
+
+    Slotted-dataclass construction is several times cheaper than model
+    hydration and carries only the three fields dashboards plot.
+    """
+    label: str
+    confidence: float
+    timestamp: datetime
+
+
+# Projection matching SentimentRow; _id is dropped since rows are
+# positional plot points, not addressable resources
+_ROW_PROJECTION = {"_id": 0, "label": 1, "confidence": 1, "timestamp": 1}
+
 
 class SentimentRepository(BaseRepository[SentimentResult]):
     """
     Repository for sentiment analysis results with specialized query methods.
+
+    The collection is intended to shard on session_id (see
+    docs/architecture/sharding.md): analytics queries SHOULD include
+    session_id in their $match stage whenever the caller has it, so the
+    query router can target a single shard instead of fanning out.
     """
     
     def __init__(self):
         super().__init__("sentiment_results")
-    
+        # Analytics reads are cached for a short TTL; the version counter
+        # is mixed into every cache key so any write invalidates all
+        # cached aggregates without tracking individual keys
+        self._analytics_cache = AsyncTTLCache(default_ttl_seconds=30.0)
+        self._collection_version = 0
+        # Immutable pipeline tails built once; per-call code prepends its
+        # $match stage instead of reallocating the stage dicts every time
+        self._sentiment_dist_tail = ({"$sortByCount": "$label"},)
+        self._model_perf_group = {"$group": {
+            "_id": None,
+            "total_requests": {"$sum": 1},
+            "avg_processing_time": {"$avg": "$processing_time_ms"},
+            "min_processing_time": {"$min": "$processing_time_ms"},
+            "max_processing_time": {"$max": "$processing_time_ms"},
+            "avg_confidence": {"$avg": "$confidence"},
+            "avg_text_length": {"$avg": "$text_length"}
+        }}
+        self._confidence_dist_tails = {
+            bins: self._build_confidence_tail(bins) for bins in (5, 10)
+        }
+        # Incremental label counts fed by a change stream; when primed,
+        # unfiltered get_sentiment_distribution reads are O(1) in memory
+        self._label_counter: Counter = Counter()
+        self._label_counter_primed = False
+        self._stream_task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _build_confidence_tail(bins: int) -> tuple:
+        """Build the $bucket tail for a confidence histogram."""
+        bin_size = 1.0 / bins
+        return ({
+            "$bucket": {
+                "groupBy": "$confidence",
+                "boundaries": [i * bin_size for i in range(bins + 1)],
+                "default": "other",
+                "output": {"count": {"$sum": 1}}
+            }
+        },)
+
+    async def create(self, model: SentimentResult) -> SentimentResult:
+        """Create a result and invalidate cached analytics."""
+        created = await super().create(model)
+        self._collection_version += 1
+        await self._bump_confidence_histogram(
+            {(model.model_name, self._confidence_bin(model.confidence)): 1}
+        )
+        return created
+
+    @staticmethod
+    def _confidence_bin(confidence: float) -> int:
+        """Map a confidence score to its rolling-histogram bin index."""
+        return min(int(confidence * _CONFIDENCE_BINS), _CONFIDENCE_BINS - 1)
+
+    async def _bump_confidence_histogram(self, updates: Dict[tuple, int]) -> None:
+        """
+        $inc the rolling histogram counters for newly inserted results.
+
+        Args:
+            updates: Mapping of (model_name, bin_index) to increment
+        """
+        if not updates:
+            return
+        try:
+            collection = await self.get_collection()
+            histogram = collection.database["sentiment_confidence_histogram"]
+            await histogram.bulk_write(
+                [
+                    UpdateOne(
+                        {"model_name": model_name, "bin": bin_index},
+                        {"$inc": {"count": count}},
+                        upsert=True
+                    )
+                    for (model_name, bin_index), count in updates.items()
+                ],
+                ordered=False
+            )
+        except Exception as e:
+            # Counter drift only degrades the fast read path; the $bucket
+            # fallback still answers correctly
+            logger.error(f"Error updating confidence histogram: {e}")
+
     def _to_document(self, model: SentimentResult) -> Dict[str, Any]:
         """Convert SentimentResult to MongoDB document."""
-        return model.model_dump(by_alias=True)
+        # Plain __dict__ copy with the _id alias; see _MongoDoc.to_dict
+        return model.to_document()
     
     def _from_document(self, document: Dict[str, Any]) -> SentimentResult:
         """Convert MongoDB document to SentimentResult."""
+        if _TRUST_DB_DOCS:
+            return SentimentResult.from_mongo(document)
+        if "_id" in document:
+            document["id"] = document.pop("_id")
         return SentimentResult(**document)
     
+    async def insert_many(self, models: List[SentimentResult]) -> List[SentimentResult]:
+        """
+        Insert multiple sentiment results in a single round-trip.
+
+        Args:
+            models: The sentiment results to insert
+
+        Returns:
+            List[SentimentResult]: The inserted models
+
+        Raises:
+            PyMongoError: If the bulk insert fails
+        """
+        if not models:
+            return []
+
+        collection = await self.get_collection()
+        documents = [self._to_document(model) for model in models]
+
+        result = await collection.insert_many(documents, ordered=False)
+        self._collection_version += 1
+        logger.debug(f"Inserted {len(result.inserted_ids)} sentiment results")
+
+        histogram_updates: Dict[tuple, int] = {}
+        for model in models:
+            key = (model.model_name, self._confidence_bin(model.confidence))
+            histogram_updates[key] = histogram_updates.get(key, 0) + 1
+        await self._bump_confidence_histogram(histogram_updates)
+
+        return models
+
     async def get_by_session_id(
-        self, 
+        self,
         session_id: str,
         limit: Optional[int] = 100,
-        skip: Optional[int] = None
+        skip: Optional[int] = None,
+        before: Optional[Tuple[datetime, str]] = None
     ) -> List[SentimentResult]:
         """
         Get sentiment results for a specific session.
-        
+
         Args:
             session_id: The session identifier
             limit: Maximum number of results to return
             skip: Number of results to skip
-            
+            before: Optional (timestamp, id) keyset cursor; only rows
+                strictly older than it are returned, so deep pages cost
+                an index seek instead of a skip scan
+
         Returns:
             List[SentimentResult]: List of sentiment results ordered by timestamp (newest first)
         """
+        filter_dict: Dict[str, Any] = {"session_id": session_id}
+        if before is not None:
+            timestamp, last_id = before
+            filter_dict["$or"] = [
+                {"timestamp": {"$lt": timestamp}},
+                {"timestamp": timestamp, "_id": {"$lt": last_id}},
+            ]
         return await self.get_many(
-            filter_dict={"session_id": session_id},
+            filter_dict=filter_dict,
             limit=limit,
             skip=skip,
-            sort=[("timestamp", DESCENDING)]
+            # _id tiebreaker keeps the order (and therefore the cursor)
+            # deterministic when timestamps collide
+            sort=[("timestamp", DESCENDING), ("_id", DESCENDING)],
+            projection=_HISTORY_PROJECTION
         )
     
+    async def stream_by_session_id(
+        self,
+        session_id: str,
+        limit: Optional[int] = None
+    ):
+        """
+        Stream sentiment results for a session as the cursor yields them.
+
+        Unlike get_by_session_id, documents are never materialized into a
+        single list, keeping peak memory flat for large sessions.
+
+        Args:
+            session_id: The session identifier
+            limit: Optional maximum number of results to yield
+
+        Yields:
+            SentimentResult: Results ordered by timestamp (newest first)
+        """
+        collection = await self.get_collection()
+
+        cursor = collection.find(
+            {"session_id": session_id},
+            _HISTORY_PROJECTION,
+            comment="SentimentRepository.stream_by_session_id"
+        ).sort("timestamp", DESCENDING)
+        if limit:
+            cursor = cursor.limit(limit)
+
+        async for document in cursor:
+            yield self._from_document(document)
+
     async def get_recent_results(
         self,
         hours: int = 24,
@@ -84,8 +302,11 @@ class SentimentRepository(BaseRepository[SentimentResult]):
             # Query with explicit timestamp comparison
             query = {"timestamp": {"$gte": cutoff_time}}
             
-            # Execute query
-            cursor = collection.find(query)
+            # Execute query, projecting away fields the overview never shows
+            cursor = collection.find(
+                query, _RECENT_PROJECTION,
+                comment="SentimentRepository.get_recent_results"
+            )
             cursor = cursor.sort("timestamp", DESCENDING)
             if limit:
                 cursor = cursor.limit(limit)
@@ -111,6 +332,46 @@ class SentimentRepository(BaseRepository[SentimentResult]):
             logger.error(f"Error getting recent results: {e}", exc_info=True)
             return []
     
+    async def get_recent_rows(
+        self,
+        hours: int = 24,
+        limit: Optional[int] = 1000
+    ) -> List[SentimentRow]:
+        """
+        Get recent results as lightweight SentimentRow records.
+
+        Dashboard plots only need (label, confidence, timestamp); this
+        variant projects exactly those fields and builds slotted
+        dataclasses instead of full models, keeping large windows cheap.
+
+        Args:
+            hours: Number of hours to look back
+            limit: Maximum number of rows to return
+
+        Returns:
+            List[SentimentRow]: Rows ordered by timestamp (newest first)
+        """
+        try:
+            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+
+            collection = await self.get_collection()
+            cursor = collection.find(
+                {"timestamp": {"$gte": cutoff_time}},
+                _ROW_PROJECTION,
+                comment="SentimentRepository.get_recent_rows"
+            ).sort("timestamp", DESCENDING)
+            if limit:
+                cursor = cursor.limit(limit)
+
+            return [
+                SentimentRow(doc["label"], doc["confidence"], doc["timestamp"])
+                async for doc in cursor
+            ]
+
+        except Exception as e:
+            logger.error(f"Error getting recent rows: {e}")
+            return []
+
     async def get_by_model_name(
         self,
         model_name: str,
@@ -129,7 +390,8 @@ class SentimentRepository(BaseRepository[SentimentResult]):
         return await self.get_many(
             filter_dict={"model_name": model_name},
             limit=limit,
-            sort=[("timestamp", DESCENDING)]
+            sort=[("timestamp", DESCENDING)],
+            projection=_HISTORY_PROJECTION
         )
     
     async def get_sentiment_distribution(
@@ -148,8 +410,13 @@ class SentimentRepository(BaseRepository[SentimentResult]):
             Dict[str, int]: Count of each sentiment label
         """
         try:
+            # Unfiltered reads come straight from the change-stream-fed
+            # counter when it is live; filtered queries still aggregate
+            if session_id is None and hours is None and self._label_counter_primed:
+                return dict(self._label_counter)
+
             collection = await self.get_collection()
-            
+
             # Build match stage for aggregation
             match_stage = {}
             if session_id:
@@ -158,18 +425,15 @@ class SentimentRepository(BaseRepository[SentimentResult]):
                 cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
                 match_stage["timestamp"] = {"$gte": cutoff_time}
             
-            # Aggregation pipeline
-            pipeline = []
+            # $sortByCount groups and sorts in a single server-side stage
+            pipeline = [*self._sentiment_dist_tail]
             if match_stage:
-                pipeline.append({"$match": match_stage})
-            
-            pipeline.extend([
-                {"$group": {"_id": "$label", "count": {"$sum": 1}}},
-                {"$sort": {"count": -1}}
-            ])
+                pipeline.insert(0, {"$match": match_stage})
             
             # Execute aggregation
-            cursor = collection.aggregate(pipeline)
+            cursor = collection.aggregate(
+                pipeline, comment="SentimentRepository.get_sentiment_distribution"
+            )
             results = await cursor.to_list(length=None)
             
             # Convert to dictionary
@@ -203,21 +467,15 @@ class SentimentRepository(BaseRepository[SentimentResult]):
                 "timestamp": {"$gte": cutoff_time}
             }
             
-            # Aggregation pipeline for statistics
+            # Aggregation pipeline for statistics (precompiled group stage)
             pipeline = [
                 {"$match": match_stage},
-                {"$group": {
-                    "_id": None,
-                    "total_requests": {"$sum": 1},
-                    "avg_processing_time": {"$avg": "$processing_time_ms"},
-                    "min_processing_time": {"$min": "$processing_time_ms"},
-                    "max_processing_time": {"$max": "$processing_time_ms"},
-                    "avg_confidence": {"$avg": "$confidence"},
-                    "avg_text_length": {"$avg": "$text_length"}
-                }}
+                self._model_perf_group
             ]
             
-            cursor = collection.aggregate(pipeline)
+            cursor = collection.aggregate(
+                pipeline, comment="SentimentRepository.get_model_performance_stats"
+            )
             results = await cursor.to_list(length=1)
             
             if results:
@@ -239,6 +497,198 @@ class SentimentRepository(BaseRepository[SentimentResult]):
             logger.error(f"Error getting model performance stats: {e}")
             return {}
     
+    async def get_model_usage_stats(self, hours: int = 24) -> Dict[str, Any]:
+        """
+        Get per-model usage statistics aggregated on the server.
+
+        Groups by (model_name, label) in MongoDB so only a handful of
+        summary rows cross the wire instead of raw result documents.
+
+        Args:
+            hours: Number of hours to look back
+
+        Returns:
+            Dict[str, Any]: Per-model stats with request counts, averages and
+                sentiment label counts
+        """
+        try:
+            collection = await self.get_collection()
+
+            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+
+            pipeline = [
+                {"$match": {"timestamp": {"$gte": cutoff_time}}},
+                {"$group": {
+                    "_id": {"model": "$model_name", "label": "$label"},
+                    "count": {"$sum": 1},
+                    "sum_confidence": {"$sum": "$confidence"},
+                    "sum_processing_time": {"$sum": "$processing_time_ms"}
+                }}
+            ]
+
+            cursor = collection.aggregate(
+                pipeline, comment="SentimentRepository.get_model_usage_stats"
+            )
+            results = await cursor.to_list(length=None)
+
+            # Shape the grouped rows into per-model statistics
+            model_stats = {}
+            for row in results:
+                model_name = row["_id"]["model"]
+                label = row["_id"]["label"]
+
+                if model_name not in model_stats:
+                    model_stats[model_name] = {
+                        "total_requests": 0,
+                        "sum_confidence": 0.0,
+                        "sum_processing_time": 0.0,
+                        "sentiment_counts": {}
+                    }
+
+                stats = model_stats[model_name]
+                stats["total_requests"] += row["count"]
+                stats["sum_confidence"] += row["sum_confidence"]
+                stats["sum_processing_time"] += row["sum_processing_time"]
+                stats["sentiment_counts"][label] = row["count"]
+
+            # Convert sums to rounded averages
+            for stats in model_stats.values():
+                n = stats.pop("total_requests")
+                stats["total_requests"] = n
+                stats["avg_confidence"] = round(stats.pop("sum_confidence") / n, 3) if n else 0
+                stats["avg_processing_time"] = round(stats.pop("sum_processing_time") / n, 2) if n else 0
+
+            return model_stats
+
+        except Exception as e:
+            logger.error(f"Error getting model usage stats: {e}")
+            return {}
+
+    @staticmethod
+    def _shape_confidence_bins(results: List[Dict[str, Any]], bin_size: float) -> Dict[str, int]:
+        """Turn raw $bucket rows into the readable range -> count mapping."""
+        distribution = {}
+        for result in results:
+            if result["_id"] == "other":
+                distribution["other"] = result["count"]
+            else:
+                lower = result["_id"]
+                upper = min(lower + bin_size, 1.0)
+                range_key = f"{lower:.1f}-{upper:.1f}"
+                distribution[range_key] = result["count"]
+        return distribution
+
+    async def get_analytics_bundle(
+        self,
+        session_id: Optional[str] = None,
+        hours: Optional[int] = None,
+        model_name: Optional[str] = None,
+        bins: int = 5
+    ) -> Dict[str, Any]:
+        """
+        Run every analytics aggregation in a single $facet pipeline.
+
+        One $match scan feeds the label distribution, confidence summary,
+        confidence histogram and per-model performance sub-pipelines, so
+        dashboards that want several views pay for one collection scan
+        instead of one per metric.
+
+        Args:
+            session_id: Optional session filter
+            hours: Optional time filter (hours back from now)
+            model_name: Optional model filter
+            bins: Number of confidence histogram bins
+
+        Returns:
+            Dict[str, Any]: Raw facet results keyed by label_distribution,
+                confidence_stats, confidence_bins and model_performance
+        """
+        return await self._analytics_cache.get_or_compute(
+            ("analytics_bundle", session_id, hours, model_name, bins,
+             self._collection_version),
+            lambda: self._compute_analytics_bundle(
+                session_id=session_id, hours=hours,
+                model_name=model_name, bins=bins
+            )
+        )
+
+    async def _compute_analytics_bundle(
+        self,
+        session_id: Optional[str] = None,
+        hours: Optional[int] = None,
+        model_name: Optional[str] = None,
+        bins: int = 5
+    ) -> Dict[str, Any]:
+        """Run the $facet aggregation behind get_analytics_bundle."""
+        empty: Dict[str, Any] = {
+            "label_distribution": [],
+            "confidence_stats": [],
+            "confidence_bins": [],
+            "model_performance": []
+        }
+        try:
+            collection = await self.get_collection()
+
+            match_stage = {}
+            if session_id:
+                match_stage["session_id"] = session_id
+            if model_name:
+                match_stage["model_name"] = model_name
+            if hours:
+                cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+                match_stage["timestamp"] = {"$gte": cutoff_time}
+
+            bin_size = 1.0 / bins
+            bucket_boundaries = [i * bin_size for i in range(bins + 1)]
+
+            pipeline = []
+            if match_stage:
+                pipeline.append({"$match": match_stage})
+            pipeline.append({"$facet": {
+                "label_distribution": [
+                    {"$sortByCount": "$label"}
+                ],
+                "confidence_stats": [
+                    {"$group": {
+                        "_id": None,
+                        "total_analyses_considered": {"$sum": 1},
+                        "average_confidence": {"$avg": "$confidence"},
+                        "min_confidence": {"$min": "$confidence"},
+                        "max_confidence": {"$max": "$confidence"},
+                        "std_dev_confidence": {"$stdDevPop": "$confidence"}
+                    }}
+                ],
+                "confidence_bins": [
+                    {"$bucket": {
+                        "groupBy": "$confidence",
+                        "boundaries": bucket_boundaries,
+                        "default": "other",
+                        "output": {"count": {"$sum": 1}}
+                    }}
+                ],
+                "model_performance": [
+                    {"$group": {
+                        "_id": "$model_name",
+                        "total_requests": {"$sum": 1},
+                        "avg_processing_time": {"$avg": "$processing_time_ms"},
+                        "min_processing_time": {"$min": "$processing_time_ms"},
+                        "max_processing_time": {"$max": "$processing_time_ms"},
+                        "avg_confidence": {"$avg": "$confidence"},
+                        "avg_text_length": {"$avg": "$text_length"}
+                    }}
+                ]
+            }})
+
+            cursor = collection.aggregate(
+                pipeline, comment="SentimentRepository.get_analytics_bundle"
+            )
+            results = await cursor.to_list(length=1)
+            return results[0] if results else empty
+
+        except Exception as e:
+            logger.error(f"Error getting analytics bundle: {e}")
+            return empty
+
     async def get_confidence_distribution(
         self,
         model_name: Optional[str] = None,
@@ -256,47 +706,49 @@ class SentimentRepository(BaseRepository[SentimentResult]):
         """
         try:
             collection = await self.get_collection()
-            
+
+            # Fast path: at the rolling histogram's granularity, serve the
+            # distribution from the pre-maintained counters (a handful of
+            # documents) instead of bucketing the whole collection
+            if bins == _CONFIDENCE_BINS:
+                histogram = collection.database["sentiment_confidence_histogram"]
+                query = {"model_name": model_name} if model_name else {}
+                rows = await histogram.find(
+                    query, comment="SentimentRepository.get_confidence_distribution"
+                ).to_list(length=None)
+                if rows:
+                    bin_size = 1.0 / bins
+                    distribution = {}
+                    for row in rows:
+                        lower = row["bin"] * bin_size
+                        upper = min(lower + bin_size, 1.0)
+                        range_key = f"{lower:.1f}-{upper:.1f}"
+                        distribution[range_key] = distribution.get(range_key, 0) + row["count"]
+                    return distribution
+                # Empty counters (e.g. data predating the histogram):
+                # fall through to the aggregation
+
             # Build match stage
             match_stage = {}
             if model_name:
                 match_stage["model_name"] = model_name
-            
-            # Create confidence range buckets
+
+            # Reuse the precompiled $bucket tail for common bin counts
             bin_size = 1.0 / bins
-            bucket_boundaries = [i * bin_size for i in range(bins + 1)]
-            
-            # Aggregation pipeline
-            pipeline = []
+            tail = self._confidence_dist_tails.get(bins)
+            if tail is None:
+                tail = self._build_confidence_tail(bins)
+
+            pipeline = [*tail]
             if match_stage:
-                pipeline.append({"$match": match_stage})
-            
-            pipeline.extend([
-                {
-                    "$bucket": {
-                        "groupBy": "$confidence",
-                        "boundaries": bucket_boundaries,
-                        "default": "other",
-                        "output": {"count": {"$sum": 1}}
-                    }
-                }
-            ])
-            
-            cursor = collection.aggregate(pipeline)
+                pipeline.insert(0, {"$match": match_stage})
+
+            cursor = collection.aggregate(
+                pipeline, comment="SentimentRepository.get_confidence_distribution"
+            )
             results = await cursor.to_list(length=None)
-            
-            # Convert to readable format
-            distribution = {}
-            for result in results:
-                if result["_id"] == "other":
-                    distribution["other"] = result["count"]
-                else:
-                    lower = result["_id"]
-                    upper = min(lower + bin_size, 1.0)
-                    range_key = f"{lower:.1f}-{upper:.1f}"
-                    distribution[range_key] = result["count"]
-            
-            return distribution
+
+            return self._shape_confidence_bins(results, bin_size)
             
         except Exception as e:
             logger.error(f"Error getting confidence distribution: {e}")
@@ -310,37 +762,25 @@ class SentimentRepository(BaseRepository[SentimentResult]):
             Dict[str, Any]: Confidence overview statistics
         """
         try:
-            collection = await self.get_collection()
-            
-            # Aggregation pipeline for confidence statistics
-            pipeline = [
-                {"$group": {
-                    "_id": None,
-                    "total_analyses_considered": {"$sum": 1},
-                    "average_confidence": {"$avg": "$confidence"},
-                    "min_confidence": {"$min": "$confidence"},
-                    "max_confidence": {"$max": "$confidence"},
-                    "std_dev_confidence": {"$stdDevPop": "$confidence"}
-                }}
-            ]
-            
-            cursor = collection.aggregate(pipeline)
-            results = await cursor.to_list(length=1)
-            
+            # One $facet scan yields both the summary stats and the
+            # 5-bin histogram that used to take two aggregations
+            bundle = await self.get_analytics_bundle(bins=5)
+            results = bundle.get("confidence_stats") or []
+
             if results:
-                stats = results[0]
+                stats = dict(results[0])
                 del stats["_id"]  # Remove the grouping key
-                
+
                 # Round values for better readability
                 stats["average_confidence"] = round(stats["average_confidence"], 4)
                 stats["min_confidence"] = round(stats["min_confidence"], 4)
                 stats["max_confidence"] = round(stats["max_confidence"], 4)
                 stats["std_dev_confidence"] = round(stats["std_dev_confidence"], 4)
-                
-                # Get confidence distribution for overview
-                distribution = await self.get_confidence_distribution(bins=5)
-                stats["confidence_distribution"] = distribution
-                
+
+                stats["confidence_distribution"] = self._shape_confidence_bins(
+                    bundle.get("confidence_bins") or [], 1.0 / 5
+                )
+
                 return stats
             else:
                 return {
@@ -363,30 +803,183 @@ class SentimentRepository(BaseRepository[SentimentResult]):
                 "confidence_distribution": {}
             }
     
-    async def initialize_indexes(self) -> None:
+    def start_label_stream(self) -> None:
+        """
+        Start the change-stream watcher that keeps label counts current.
+
+        Called from the application lifespan after the database is bound;
+        a no-op if the watcher is already running.
+        """
+        if self._stream_task is None or self._stream_task.done():
+            self._stream_task = asyncio.create_task(self._watch_labels())
+
+    async def stop_label_stream(self) -> None:
+        """Cancel the change-stream watcher on shutdown."""
+        if self._stream_task is not None:
+            self._stream_task.cancel()
+            try:
+                await self._stream_task
+            except asyncio.CancelledError:
+                pass
+            self._stream_task = None
+
+    async def _watch_labels(self) -> None:
+        """
+        Maintain the in-memory label counter from a change stream.
+
+        Opens the change stream, seeds the counter with one aggregation,
+        then applies insert events as they arrive. Requires a replica
+        set; on standalone deployments the watch call fails and reads
+        simply keep using the aggregation path.
+        """
+        try:
+            collection = await self.get_collection()
+
+            async with collection.watch(
+                [{"$match": {"operationType": "insert"}}]
+            ) as stream:
+                # Seed only after the stream is open: an insert landing
+                # during the aggregation then surfaces as a buffered
+                # event instead of being silently missed. It may get
+                # counted twice (once by the seed, once by its event),
+                # a small transient error versus a permanent undercount.
+                cursor = collection.aggregate(
+                    [*self._sentiment_dist_tail],
+                    comment="SentimentRepository._watch_labels"
+                )
+                seed = await cursor.to_list(length=None)
+                self._label_counter = Counter(
+                    {row["_id"]: row["count"] for row in seed}
+                )
+                self._label_counter_primed = True
+                async for change in stream:
+                    label = change.get("fullDocument", {}).get("label")
+                    if label is not None:
+                        self._label_counter[label] += 1
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._label_counter_primed = False
+            logger.warning(
+                f"Label change stream unavailable, falling back to aggregation: {e}"
+            )
+
+    async def refresh_hourly_rollups(self, window_hours: int = 2) -> None:
+        """
+        Fold recent raw results into the sentiment_hourly rollup collection.
+
+        Groups results by (hour bucket, model, label) and $merges them into
+        sentiment_hourly, replacing any buckets touched by the window.
+        Re-processing a trailing window keeps the current (still-filling)
+        hour accurate without rescanning history.
+
+        Args:
+            window_hours: How far back to re-aggregate on each refresh
+        """
+        try:
+            collection = await self.get_collection()
+
+            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=window_hours)
+
+            pipeline = [
+                {"$match": {"timestamp": {"$gte": cutoff_time}}},
+                {"$group": {
+                    "_id": {
+                        "hour": {"$dateTrunc": {"date": "$timestamp", "unit": "hour"}},
+                        "model": "$model_name",
+                        "label": "$label"
+                    },
+                    "count": {"$sum": 1},
+                    "sum_confidence": {"$sum": "$confidence"},
+                    "sum_processing_time": {"$sum": "$processing_time_ms"}
+                }},
+                {"$merge": {
+                    "into": "sentiment_hourly",
+                    "on": "_id",
+                    "whenMatched": "replace",
+                    "whenNotMatched": "insert"
+                }}
+            ]
+
+            await collection.aggregate(
+                pipeline, comment="SentimentRepository.refresh_hourly_rollups"
+            ).to_list(length=None)
+            logger.debug("Refreshed hourly sentiment rollups")
+
+        except Exception as e:
+            logger.error(f"Error refreshing hourly rollups: {e}")
+
+    async def get_hourly_rollups(self, hours: int = 24) -> List[Dict[str, Any]]:
+        """
+        Read pre-aggregated hourly rollups instead of scanning raw results.
+
+        Args:
+            hours: Number of hours to look back
+
+        Returns:
+            List[Dict[str, Any]]: One row per (hour, model, label) bucket
+        """
+        try:
+            collection = await self.get_collection()
+            rollups = collection.database["sentiment_hourly"]
+
+            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+
+            cursor = rollups.find(
+                {"_id.hour": {"$gte": cutoff_time}},
+                comment="SentimentRepository.get_hourly_rollups"
+            )
+            return await cursor.to_list(length=None)
+
+        except Exception as e:
+            logger.error(f"Error reading hourly rollups: {e}")
+            return []
+
+    async def initialize_indexes(self, existing_names: Optional[Set[str]] = None) -> None:
         """
         Create indexes for optimal query performance.
+
+        Args:
+            existing_names: Index names already present on the collection
+                (from list_indexes); indexes with these names are skipped
+                so warm restarts issue no createIndexes round-trip
         """
         try:
-            # Index for session-based queries
-            await self.create_index([("session_id", 1), ("timestamp", -1)])
-            
-            # Index for time-based queries
-            await self.create_index([("timestamp", -1)])
-            
-            # Index for model-based queries
-            await self.create_index([("model_name", 1), ("timestamp", -1)])
-            
-            # Index for sentiment label analysis
-            await self.create_index([("label", 1)])
-            
-            # Compound index for analytics
-            await self.create_index([
-                ("model_name", 1), 
-                ("label", 1), 
-                ("timestamp", -1)
-            ])
-            
+            collection = await self.get_collection()
+
+            # Declare every /history query path's index in one round-trip
+            index_models = [
+                # Session-based queries
+                IndexModel([("session_id", 1), ("timestamp", -1)]),
+                # Covering index: per-session distribution/confidence
+                # aggregations read label and confidence straight from the
+                # index without fetching documents
+                IndexModel([
+                    ("session_id", 1), ("timestamp", -1),
+                    ("label", 1), ("confidence", 1)
+                ]),
+                # Time-based queries
+                IndexModel([("timestamp", -1)]),
+                # Model-based queries
+                IndexModel([("model_name", 1), ("timestamp", -1)]),
+                # Sentiment label analysis
+                IndexModel([("label", 1)]),
+                # Compound index for analytics
+                IndexModel([("model_name", 1), ("label", 1), ("timestamp", -1)]),
+            ]
+            if existing_names:
+                index_models = [
+                    model for model in index_models
+                    if default_index_name(model) not in existing_names
+                ]
+            if not index_models:
+                logger.info(f"Indexes on {self.collection_name} already present")
+                return
+
+            await collection.create_indexes(index_models)
+            logger.info(f"Created indexes on {self.collection_name}")
+
         except Exception as e:
             logger.error(f"Error creating indexes: {e}")
             raise
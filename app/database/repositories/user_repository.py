@@ -4,14 +4,19 @@ Repository for user sessions.
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set
 
-from app.database.repositories.base import BaseRepository
+from app.database.repositories.base import BaseRepository, current_utc, default_index_name
 from app.models.database import UserSession
-from pymongo import DESCENDING # Import DESCENDING
+from pymongo import DESCENDING, IndexModel, ReturnDocument # Import DESCENDING
 
 logger = logging.getLogger(__name__)
 
+# Session documents are written exclusively by this application, so
+# reads skip Pydantic re-validation (same switch as the sentiment
+# repository)
+_TRUST_DB_DOCS = True
+
 class UserSessionRepository(BaseRepository[UserSession]):
     """
     Repository for user session data with specialized query methods.
@@ -22,13 +27,16 @@ class UserSessionRepository(BaseRepository[UserSession]):
 
     def _to_document(self, model: UserSession) -> Dict[str, Any]:
         """Convert UserSession to MongoDB document."""
-        return model.model_dump(by_alias=True)
+        # Plain __dict__ copy with the _id alias; see _MongoDoc.to_dict
+        return model.to_document()
 
     def _from_document(self, document: Dict[str, Any]) -> UserSession:
         """Convert MongoDB document to UserSession."""
-        if "_id" in document and "id" not in document:
-            document["id"] = str(document["_id"])
         document.setdefault("ip_address", None)  # Ensure ip_address is always present
+        if _TRUST_DB_DOCS:
+            return UserSession.from_mongo(document)
+        if "_id" in document and "id" not in document:
+            document["id"] = str(document.pop("_id"))
         return UserSession(**document)
 
     async def get_by_session_id(self, session_id: str) -> Optional[UserSession]:
@@ -76,15 +84,23 @@ class UserSessionRepository(BaseRepository[UserSession]):
             sort=[(sort_by, sort_order)]
         )
 
-    async def count_all_sessions(self) -> int:
+    async def count_all_sessions(self, approximate: bool = False) -> int:
         """
         Count all user sessions.
 
+        Args:
+            approximate: When True, read the count from collection
+                metadata via estimated_document_count - O(1) instead of
+                an index walk, at the cost of small drift. Suitable for
+                dashboard widgets.
+
         Returns:
             int: Total number of user sessions.
         """
         try:
             collection = await self.get_collection()
+            if approximate:
+                return await collection.estimated_document_count()
             count = await collection.count_documents({})
             return count
         except Exception as e:
@@ -98,36 +114,48 @@ class UserSessionRepository(BaseRepository[UserSession]):
         ip_address: Optional[str] = None
     ) -> UserSession:
         """
-        Get an existing session or create a new one.
-        
+        Ensure a session exists and refresh its last-activity timestamp.
+
+        Implemented as a single indexed upsert: $setOnInsert populates the
+        document on first sight of the session_id, $set refreshes
+        last_activity on every call, and ReturnDocument.AFTER hands back
+        the up-to-date session without a second read. One round-trip, no
+        find-then-insert race under concurrent requests.
+
         Args:
             session_id: The session identifier
             user_agent: Optional user agent string
             ip_address: Optional IP address
-            
+
         Returns:
             UserSession: The existing or newly created session
         """
         try:
-            # Try to find existing session
-            existing_session = await self.get_by_session_id(session_id)
-            
-            if existing_session:
-                # Update last activity time
-                await self.update_session_activity(
-                    session_id=session_id,
-                    model_name=None  # Will be updated later when we know the model
-                )
-                return existing_session
-            else:
-                # Create new session
-                new_session = UserSession(
-                    session_id=session_id,
-                    user_agent=user_agent,
-                    ip_address=ip_address
-                )
-                return await self.create(new_session)
-                
+            now = current_utc()
+            new_session = UserSession(
+                session_id=session_id,
+                user_agent=user_agent,
+                ip_address=ip_address,
+                created_at=now,
+                last_activity=now
+            )
+            insert_doc = self._to_document(new_session)
+            # last_activity is handled by $set; the same key can't appear
+            # in both update operators
+            del insert_doc["last_activity"]
+
+            collection = await self.get_collection()
+            document = await collection.find_one_and_update(
+                {"session_id": session_id},
+                {
+                    "$setOnInsert": insert_doc,
+                    "$set": {"last_activity": now}
+                },
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+            return self._from_document(document)
+
         except Exception as e:
             logger.error(f"Error getting or creating session {session_id}: {e}")
             raise
@@ -139,50 +167,61 @@ class UserSessionRepository(BaseRepository[UserSession]):
     ) -> None:
         """
         Update session activity timestamp and model usage.
-        
+
+        A single atomic update: $addToSet records the model only if new
+        and $inc bumps the counter server-side, replacing the previous
+        read-modify-write (two round-trips and a lost-update race under
+        concurrent requests).
+
         Args:
             session_id: The session identifier
             model_name: Optional model name to add to models_used list
         """
         try:
-            from datetime import datetime, timezone
-            
-            update_data = {"last_activity": datetime.now(timezone.utc)}
-            
+            update: Dict[str, Any] = {"$set": {"last_activity": current_utc()}}
             if model_name:
-                # Add model to models_used if not already present
-                session = await self.get_by_session_id(session_id)
-                if session and model_name not in session.models_used:
-                    update_data["models_used"] = session.models_used + [model_name]
-                
-                # Increment total analyses count
-                if session:
-                    update_data["total_analyses"] = session.total_analyses + 1
-            
+                update["$addToSet"] = {"models_used": model_name}
+                update["$inc"] = {"total_analyses": 1}
+
             collection = await self.get_collection()
-            await collection.update_one(
-                {"session_id": session_id},
-                {"$set": update_data}
-            )
+            await collection.update_one({"session_id": session_id}, update)
             
         except Exception as e:
             logger.error(f"Error updating session activity for {session_id}: {e}")
             raise
 
-    async def initialize_indexes(self) -> None:
+    async def initialize_indexes(self, existing_names: Optional[Set[str]] = None) -> None:
         """
         Create indexes for optimal query performance on user sessions.
+
+        Args:
+            existing_names: Index names already present on the collection
+                (from list_indexes); indexes with these names are skipped
+                so warm restarts issue no createIndexes round-trip
         """
         try:
-            # Index for fast session_id lookups
-            await self.create_index([("session_id", 1)], unique=True)
-            
-            # Index for sorting by last_activity (e.g., for cleanup)
-            await self.create_index([("last_activity", DESCENDING)])
-            
-            # Index for sorting by creation date
-            await self.create_index([("created_at", DESCENDING)])
-            
+            collection = await self.get_collection()
+
+            # One round-trip for all session indexes
+            index_models = [
+                # Fast session_id lookups
+                IndexModel([("session_id", 1)], unique=True),
+                # Sorting by last_activity (e.g., for cleanup)
+                IndexModel([("last_activity", DESCENDING)]),
+                # Sorting by creation date
+                IndexModel([("created_at", DESCENDING)]),
+            ]
+            if existing_names:
+                index_models = [
+                    model for model in index_models
+                    if default_index_name(model) not in existing_names
+                ]
+            if not index_models:
+                logger.info(f"Indexes for '{self.collection_name}' already present.")
+                return
+
+            await collection.create_indexes(index_models)
+
             logger.info(f"Indexes for '{self.collection_name}' created successfully.")
             
         except Exception as e:
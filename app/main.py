@@ -1,17 +1,17 @@
 import logging
 import time
 from contextlib import asynccontextmanager
-from typing import Callable
 import asyncio
 
 from fastapi import FastAPI, Request
-from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from app.api.v1.router import api_router
 from app.core.exceptions import CustomException
-from app.core.logging import setup_logging
+from app.core.logging import setup_logging, shutdown_logging
+from app.core.middleware import ProcessTimeMiddleware, WildcardCORSMiddleware
 from app.database.connection import database_manager
+from app.config import response_class
 from app.database.migrations.init_db import initialize_database
 
 # Set up logging configuration
@@ -27,6 +27,12 @@ async def lifespan(app: FastAPI):
     # Setup - runs before application starts accepting requests
     setup_logging()
     app.state.start_time = time.time()
+    # Monotonic start reference for uptime deltas; loop.time() is immune
+    # to wall-clock adjustments and cheaper than gettimeofday
+    app.state.start_loop_time = asyncio.get_running_loop().time()
+    # Static portion of the /health payload; constant for the process
+    # lifetime, so build it once instead of per hit
+    app.state.health_template = {"status": "healthy", "version": app.version}
 
     # Initialize database connection and setup
     try:
@@ -42,6 +48,20 @@ async def lifespan(app: FastAPI):
 
             # Initialize database (indexes, collections, etc.)
             await initialize_database()
+
+            # Bind repositories to the resolved database so per-call
+            # collection lookups disappear from the request path
+            from app.database.repositories.sentiment_repository import sentiment_repository
+            from app.database.repositories.user_repository import user_session_repository
+
+            db = database_manager.get_database()
+            sentiment_repository.bind(db)
+            user_session_repository.bind(db)
+
+            # Keep label counts current via a change stream; degrades to
+            # aggregation-backed reads on standalone deployments
+            sentiment_repository.start_label_stream()
+
             logger.info("Database initialization complete")
         else:
             logger.error("Database health check failed")
@@ -54,11 +74,64 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize database: {e}")
         raise
 
+    # Prewarm the default sentiment model so the first request doesn't pay
+    # the model-load cost. Failure here is non-fatal - the model will be
+    # loaded lazily on first use instead.
+    from app.config import settings
+
+    try:
+        from app.api.v1.sentiment import get_analyzer
+        from app.services.model_manager import model_manager
+
+        # Default-model registration is deferred out of import time;
+        # startup owns the metadata I/O instead
+        model_manager.ensure_defaults_registered()
+        await get_analyzer(settings.DEFAULT_MODEL)
+        logger.info(f"Prewarmed default model: {settings.DEFAULT_MODEL}")
+    except Exception as e:
+        logger.warning(f"Failed to prewarm default model: {e}")
+
+    # Keep analytics rollups fresh in the background so dashboard queries
+    # can read small pre-aggregated buckets instead of raw results.
+    # Gated off by default: the refresh is pure aggregation load until
+    # an endpoint actually consumes the rollup collection.
+    rollup_task = None
+    if settings.HOURLY_ROLLUPS_ENABLED:
+        async def refresh_rollups_periodically():
+            from app.database.repositories.sentiment_repository import sentiment_repository
+
+            while True:
+                try:
+                    await sentiment_repository.refresh_hourly_rollups()
+                except Exception as e:
+                    logger.error(f"Hourly rollup refresh failed: {e}")
+                await asyncio.sleep(60)
+
+        rollup_task = asyncio.create_task(refresh_rollups_periodically())
+
     logger.info("Application startup complete")
 
     yield
 
     # Cleanup - runs when application is shutting down
+    if rollup_task is not None:
+        rollup_task.cancel()
+        try:
+            await rollup_task
+        except asyncio.CancelledError:
+            pass
+
+    # sentiment_repository was imported during startup above
+    await sentiment_repository.stop_label_stream()
+
+    # Flush inserts still waiting out the coalescing window before the
+    # connection goes away
+    try:
+        await sentiment_repository.drain()
+        await user_session_repository.drain()
+    except Exception as e:
+        logger.error(f"Error draining buffered writes: {e}")
+
     try:
         # Close database connections using global database manager
         await database_manager.disconnect()
@@ -68,6 +141,10 @@ async def lifespan(app: FastAPI):
 
     logger.info("Application shutdown complete")
 
+    # Flush and stop the background log listener last so the shutdown
+    # messages above still make it to the handlers
+    shutdown_logging()
+
 def create_app() -> FastAPI:
     """
     Application factory pattern for creating the FastAPI app with all configurations.
@@ -80,41 +157,19 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=response_class(),
     )
     
-    # Configure CORS
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],  # In production, limit this to specific origins
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
-    
-    # Add request processing middleware
-    @app.middleware("http")
-    async def add_process_time_header(request: Request, call_next: Callable):
-        """
-        Middleware to add processing time to response headers and log request details.
-        """
-        start_time = time.time()
-        logger.debug(f"Request started: {request.method} {request.url.path}")
-        
-        try:
-            response = await call_next(request)
-            
-            # Add custom header with processing time
-            process_time = time.time() - start_time
-            response.headers["X-Process-Time"] = str(process_time)
-            
-            logger.debug(f"Request completed: {request.method} {request.url.path} - {response.status_code} ({process_time:.4f}s)")
-            return response
-        except Exception as e:
-            logger.exception(f"Request failed: {request.method} {request.url.path}")
-            return JSONResponse(
-                status_code=500,
-                content={"detail": "Internal server error"}
-            )
+    # Configure CORS. The config here is wildcard-everything, so the
+    # specialized middleware appends precomputed headers instead of
+    # running CORSMiddleware's generic matching per request. In
+    # production, limit origins and switch back to CORSMiddleware.
+    app.add_middleware(WildcardCORSMiddleware)
+
+    # Request timing/logging as a pure ASGI wrapper; added after CORS so
+    # it sits outermost, same ordering as the old @app.middleware("http")
+    # version but without BaseHTTPMiddleware's per-request task plumbing
+    app.add_middleware(ProcessTimeMiddleware)
     
     # Exception handler for custom exceptions
     @app.exception_handler(CustomException)
@@ -122,7 +177,10 @@ def create_app() -> FastAPI:
         """
         Global exception handler for handling custom exceptions.
         """
-        logger.error(f"CustomException: {exc.detail} - {request.method} {request.url.path}")
+        logger.error(
+            "CustomException: %s - %s %s",
+            exc.detail, request.method, request.url.path
+        )
         return JSONResponse(
             status_code=exc.status_code,
             content={"detail": exc.detail}
@@ -137,11 +195,12 @@ def create_app() -> FastAPI:
         """
         Health check endpoint to verify API is running and provide basic system info.
         """
-        uptime = time.time() - app.state.start_time
+        # One dict copy of the prebuilt template plus the two dynamic
+        # fields; the default response class does the C-level encoding
+        loop = asyncio.get_running_loop()
         return {
-            "status": "healthy",
-            "version": app.version,
-            "uptime_seconds": uptime,
+            **app.state.health_template,
+            "uptime_seconds": loop.time() - app.state.start_loop_time,
             "server_time": time.time()
         }
     
@@ -34,9 +34,12 @@ class SentimentAnalysisRequest(BaseModel):
     @classmethod
     def validate_text(cls, v):
         """Validate that text is not just whitespace."""
-        if not v.strip():
+        # Strip once; the old check-then-assign pattern allocated the
+        # stripped string twice
+        stripped = v.strip()
+        if not stripped:
             raise ValueError('Text cannot be empty or just whitespace')
-        return v.strip()
+        return stripped
 
 
 class BatchSentimentRequest(BaseModel):
@@ -66,9 +69,10 @@ class BatchSentimentRequest(BaseModel):
     @classmethod
     def validate_texts(cls, v):
         """Validate that all texts are non-empty."""
-        validated_texts = []
-        for i, text in enumerate(v):
-            if not text.strip():
+        # One strip per item via the listcomp (the previous loop stripped
+        # twice per item); the error f-string is only built on failure
+        stripped = [text.strip() for text in v]
+        for i, text in enumerate(stripped):
+            if not text:
                 raise ValueError(f'Text at index {i} cannot be empty or just whitespace')
-            validated_texts.append(text.strip())
-        return validated_texts
\ No newline at end of file
+        return stripped
\ No newline at end of file
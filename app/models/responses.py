@@ -7,9 +7,10 @@ sentiment analysis endpoints.
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class SentimentScore(BaseModel):
@@ -107,4 +108,30 @@ class ConfidenceDistribution(BaseModel):
     high_confidence: int = Field(..., description="Number of high confidence predictions (>0.8)")
     medium_confidence: int = Field(..., description="Number of medium confidence predictions (0.5-0.8)")
     low_confidence: int = Field(..., description="Number of low confidence predictions (<0.5)")
-    average_confidence: float = Field(..., description="Average confidence across all predictions")
\ No newline at end of file
+    average_confidence: float = Field(..., description="Average confidence across all predictions")
+
+
+@lru_cache(maxsize=256)
+def adapter_for(tp: Any) -> TypeAdapter:
+    """
+    Return a cached TypeAdapter for the given type.
+
+    Building a TypeAdapter walks the full schema and dominates the cost
+    of one-off dump/validate calls by orders of magnitude, so adapters
+    for variable shapes (plain dicts, lists of models, ad-hoc unions)
+    should always come from here rather than be constructed inline.
+
+    Args:
+        tp: Any hashable type expression (model class, Dict[str, Any], ...)
+
+    Returns:
+        TypeAdapter: The memoized adapter for that type
+    """
+    return TypeAdapter(tp)
+
+
+# Prebuilt serialization adapters for the hot response paths; resolved
+# through the cache above once at import time, so endpoints only pay the
+# Rust-core dump per request instead of schema lookup + jsonable_encoder.
+SINGLE_ANALYSIS_ADAPTER: TypeAdapter = adapter_for(SentimentAnalysisResponse)
+BATCH_ANALYSIS_ADAPTER: TypeAdapter = adapter_for(BatchSentimentResponse)
\ No newline at end of file
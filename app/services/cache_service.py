@@ -0,0 +1,102 @@
+"""
+In-process caching utilities.
+
+This module provides a small async TTL cache used to memoize slowly
+changing computations (e.g. analytics aggregates polled by dashboards)
+so repeated calls hit memory instead of the database.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTTLCache:
+    """
+    A simple TTL-bounded cache for async computations.
+
+    Entries are stored as (expiry, value) pairs keyed by a hashable key.
+    Concurrent callers for the same key share one in-flight computation,
+    and expired entries are evicted lazily on access.
+    """
+
+    def __init__(self, default_ttl_seconds: float = 30.0, max_entries: int = 1024):
+        self.default_ttl_seconds = default_ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+
+    def _get_lock(self, key: Hashable) -> asyncio.Lock:
+        """Get the per-key lock, creating it if it doesn't exist."""
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        return lock
+
+    async def get_or_compute(
+        self,
+        key: Hashable,
+        coro_factory: Callable[[], Awaitable[Any]],
+        ttl_seconds: float = None
+    ) -> Any:
+        """
+        Return the cached value for key, computing and storing it on a miss.
+
+        Args:
+            key: Hashable cache key
+            coro_factory: Zero-argument callable returning the awaitable
+                that produces the value
+            ttl_seconds: Optional per-entry TTL override
+
+        Returns:
+            The cached or freshly computed value
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        async with self._get_lock(key):
+            # Re-check under the lock: another caller may have refreshed it
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+
+            value = await coro_factory()
+
+            if len(self._entries) >= self.max_entries:
+                self._evict_expired()
+
+            ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl_seconds
+            self._entries[key] = (time.monotonic() + ttl, value)
+            return value
+
+    def _evict_expired(self) -> None:
+        """Drop expired entries; clear everything if none have expired."""
+        now = time.monotonic()
+        expired = [key for key, (expiry, _) in self._entries.items() if expiry <= now]
+        for key in expired:
+            self._entries.pop(key, None)
+            self._locks.pop(key, None)
+        if not expired:
+            # Cache is full of live entries; reset rather than grow unbounded
+            logger.debug("AsyncTTLCache full of live entries, clearing")
+            self._entries.clear()
+
+    def invalidate(self, key: Hashable = None) -> None:
+        """
+        Invalidate a single entry, or the whole cache when key is None.
+
+        Args:
+            key: Optional cache key to invalidate
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+
+# Shared cache for analytics endpoints polled by dashboards
+analytics_cache = AsyncTTLCache(default_ttl_seconds=30.0)
@@ -0,0 +1,130 @@
+"""
+Shared SQLite registry for model version metadata.
+
+Replaces the one-JSON-file-per-model layout: all versions live in a
+single database where a mutation is a small indexed transaction instead
+of a full-file rewrite, and reads are keyed lookups. Payloads are stored
+as opaque serialized blobs so the schema never has to track metadata
+fields.
+"""
+
+import logging
+import sqlite3
+import threading
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS versions (
+    model_id TEXT NOT NULL,
+    version TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    PRIMARY KEY (model_id, version)
+);
+CREATE TABLE IF NOT EXISTS active_versions (
+    model_id TEXT PRIMARY KEY,
+    version TEXT NOT NULL
+);
+"""
+
+
+class MetadataStore:
+    """
+    Thread-safe SQLite store mapping (model_id, version) to a payload.
+
+    One connection guarded by a lock is plenty here: writers are rare
+    (version mutations) and readers only hit it at load time. WAL mode
+    keeps the occasional concurrent reader from blocking on a writer.
+    """
+
+    __slots__ = ("db_path", "_connection", "_lock")
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self._connection.commit()
+
+    def load_model(self, model_id: str) -> Tuple[Optional[str], Dict[str, bytes]]:
+        """
+        Load all stored versions for a model.
+
+        Args:
+            model_id: The model identifier
+
+        Returns:
+            Tuple of (active version or None, {version: payload bytes})
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT version, payload FROM versions WHERE model_id = ?",
+                (model_id,)
+            ).fetchall()
+            active_row = self._connection.execute(
+                "SELECT version FROM active_versions WHERE model_id = ?",
+                (model_id,)
+            ).fetchone()
+        return (active_row[0] if active_row else None,
+                {version: payload for version, payload in rows})
+
+    def replace_model(self, model_id: str, active_version: str,
+                      payloads: Dict[str, bytes]) -> None:
+        """
+        Replace a model's stored versions and active pointer atomically.
+
+        One small transaction covers inserts, updates and deletions
+        alike, which keeps the caller's flush logic trivial.
+
+        Args:
+            model_id: The model identifier
+            active_version: Version to mark active
+            payloads: Mapping of version id to serialized metadata
+        """
+        with self._lock:
+            with self._connection:
+                self._connection.execute(
+                    "DELETE FROM versions WHERE model_id = ?", (model_id,)
+                )
+                self._connection.executemany(
+                    "INSERT INTO versions (model_id, version, payload) VALUES (?, ?, ?)",
+                    [(model_id, version, payload) for version, payload in payloads.items()]
+                )
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO active_versions (model_id, version) VALUES (?, ?)",
+                    (model_id, active_version)
+                )
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._connection.close()
+
+
+# One store per database file; version histories for different models
+# share the same registry
+_stores: Dict[str, MetadataStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_metadata_store(db_path: str) -> MetadataStore:
+    """
+    Get (or create) the shared MetadataStore for a database path.
+
+    Args:
+        db_path: Filesystem path of the SQLite registry
+
+    Returns:
+        MetadataStore: The shared store instance for that path
+    """
+    store = _stores.get(db_path)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(db_path)
+            if store is None:
+                store = MetadataStore(db_path)
+                _stores[db_path] = store
+    return store
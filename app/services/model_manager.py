@@ -1,11 +1,23 @@
+import atexit
+import hashlib
 import logging
 import os
+import threading
 import time
 import json
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+# orjson is a declared dependency, but keep the stdlib fallback so the
+# manager still works in stripped-down environments
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import torch
 from transformers import (
     AutoModelForSequenceClassification,
@@ -15,13 +27,110 @@ from transformers.modeling_utils import PreTrainedModel
 from transformers.tokenization_utils import PreTrainedTokenizer
 
 from app.config import settings
+from app.services.metadata_store import get_metadata_store
 
 logger = logging.getLogger(__name__)
 
 
+def _resolve_model_dtype() -> torch.dtype:
+    """
+    Resolve settings.MODEL_DTYPE to a torch dtype.
+
+    Half-precision weights cut per-model memory roughly in half and
+    speed up inference on hardware with native support. 'auto' picks
+    bfloat16 on GPUs that support it, float16 on other GPUs, and
+    float32 on CPU, where half precision is emulated and usually slower
+    than full precision; opt in explicitly to override.
+
+    Returns:
+        The torch dtype to pass to from_pretrained
+    """
+    dtype_name = settings.MODEL_DTYPE
+    if dtype_name != "auto":
+        return getattr(torch, dtype_name)
+    if torch.cuda.is_available():
+        return torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+    return torch.float32
+
+
+def _dir_size_bytes(path: str) -> int:
+    """
+    Total size of all regular files under a directory.
+
+    Recursive os.scandir reads st_size from the DirEntry's cached stat,
+    one syscall per entry, where os.walk + os.path.getsize stats each
+    file twice. Symlinks are not followed.
+
+    Args:
+        path: Directory to measure
+
+    Returns:
+        Combined file size in bytes
+    """
+    total = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                total += _dir_size_bytes(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
+def _quantization_enabled() -> bool:
+    """True when loaded models should be dynamically quantized to int8."""
+    return settings.QUANTIZE_INT8 and not torch.cuda.is_available()
+
+
+def _state_dict_size_mb(model: PreTrainedModel) -> float:
+    """
+    Estimate a model's in-memory weight size in megabytes.
+
+    Walks the state dict instead of the files on disk so quantized
+    models report their actual (shrunken) footprint; packed quantized
+    parameters appear as tuples of tensors, hence the recursion.
+
+    Args:
+        model: The loaded model
+
+    Returns:
+        Approximate weight size in MB
+    """
+    def tensor_bytes(value: Any) -> int:
+        if isinstance(value, torch.Tensor):
+            return value.nelement() * value.element_size()
+        if isinstance(value, (tuple, list)):
+            return sum(tensor_bytes(item) for item in value)
+        return 0
+
+    total_bytes = sum(tensor_bytes(value) for value in model.state_dict().values())
+    return total_bytes / (1024 * 1024)
+
+
 class ModelMetadata:
     """Class to store model metadata information."""
 
+    # One instance exists per version per model; slots drop the
+    # per-instance __dict__ and make field access an indexed lookup
+    __slots__ = (
+        "model_id",
+        "version",
+        "task",
+        "classes",
+        "language",
+        "description",
+        "load_time",
+        "last_used",
+        "size_mb",
+        "size_snapshot_mtime",
+        "created_at",
+        "performance_metrics",
+        "commit_hash",
+        "is_active",
+        "parent_version",
+        "_dict_cache",
+    )
+
     def __init__(
         self,
         model_id: str,
@@ -38,8 +147,11 @@ class ModelMetadata:
         self.language = language
         self.description = description
         self.load_time: Optional[float] = None
-        self.last_used: Optional[float] = None
+        self.last_used: Optional[float] = None  # runtime-only, never persisted
         self.size_mb: Optional[float] = None
+        # Checkpoint-directory mtime at the time size_mb was measured;
+        # lets repeat loads skip the directory walk when nothing changed
+        self.size_snapshot_mtime: Optional[float] = None
         
         # Version-specific metadata
         self.created_at: str = datetime.now().isoformat()
@@ -48,9 +160,19 @@ class ModelMetadata:
         self.is_active: bool = True
         self.parent_version: Optional[str] = None
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Any field write invalidates the memoized to_dict() form.
+        # last_used is exempt: access times are runtime-only state
+        # (see ModelManager._access_times) and never serialized
+        if name not in ("last_used", "_dict_cache"):
+            super().__setattr__("_dict_cache", None)
+        super().__setattr__(name, value)
+
     def to_dict(self) -> Dict[str, Any]:
-        """Convert metadata to dictionary."""
-        return {
+        """Convert metadata to dictionary, memoized until a field changes."""
+        if self._dict_cache is not None:
+            return self._dict_cache
+        self._dict_cache = {
             "model_id": self.model_id,
             "version": self.version,
             "task": self.task,
@@ -58,15 +180,17 @@ class ModelMetadata:
             "language": self.language,
             "description": self.description,
             "load_time": self.load_time,
-            "last_used": self.last_used,
             "size_mb": self.size_mb,
+            "size_snapshot_mtime": self.size_snapshot_mtime,
             "created_at": self.created_at,
             "performance_metrics": self.performance_metrics,
             "commit_hash": self.commit_hash,
             "is_active": self.is_active,
             "parent_version": self.parent_version,
         }
-        
+        return self._dict_cache
+
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ModelMetadata":
         """Create a ModelMetadata object from a dictionary."""
@@ -79,8 +203,8 @@ class ModelMetadata:
             description=data.get("description"),
         )
         metadata.load_time = data.get("load_time")
-        metadata.last_used = data.get("last_used")
         metadata.size_mb = data.get("size_mb")
+        metadata.size_snapshot_mtime = data.get("size_snapshot_mtime")
         metadata.created_at = data.get("created_at", metadata.created_at)
         metadata.performance_metrics = data.get("performance_metrics", {})
         metadata.commit_hash = data.get("commit_hash")
@@ -94,57 +218,182 @@ class ModelMetadata:
 
 class ModelVersionHistory:
     """Class to track version history for a model."""
-    
+
+    __slots__ = (
+        "model_id",
+        "metadata_dir",
+        "versions",
+        "active_version",
+        "_dirty",
+        "_flush_timer",
+        "_save_lock",
+        "_last_hash",
+        "_store",
+        "__weakref__",
+    )
+
+    # Mutations within this window coalesce into one file write
+    _FLUSH_DELAY_SECONDS = 0.5
+
+    # Metadata directories already created this process; one makedirs
+    # per directory instead of one per history construction
+    _prepared_dirs: set = set()
+
     def __init__(self, model_id: str, metadata_dir: Optional[str] = None):
         self.model_id = model_id
         self.metadata_dir = metadata_dir or os.path.join(settings.MODEL_PATH, "metadata")
         self.versions: Dict[str, ModelMetadata] = {}
         self.active_version: str = "latest"
-        os.makedirs(self.metadata_dir, exist_ok=True)
-        
+        # Debounced persistence: mutations set a dirty flag and a timer
+        # flushes once, instead of rewriting the whole file per call
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
+        # Digest of the last-persisted content; saves that would produce
+        # identical bytes are skipped entirely
+        self._last_hash: Optional[bytes] = None
+        if self.metadata_dir not in ModelVersionHistory._prepared_dirs:
+            os.makedirs(self.metadata_dir, exist_ok=True)
+            ModelVersionHistory._prepared_dirs.add(self.metadata_dir)
+
+        # All models share one SQLite registry; mutations become small
+        # indexed transactions instead of full-file JSON rewrites
+        self._store = get_metadata_store(os.path.join(self.metadata_dir, "registry.db"))
+
         # Load existing version history if available
         self._load_version_history()
+
+        # Make sure a pending debounced write isn't lost on interpreter
+        # exit. Tracked weakly through one module-level hook: an atexit
+        # registration per instance would pin every history (ad-hoc
+        # managers included) for the life of the process.
+        _live_histories.add(self)
     
     def _get_metadata_path(self) -> str:
-        """Get path to metadata file for this model."""
+        """Get path to the legacy per-model JSON metadata file."""
         return os.path.join(self.metadata_dir, f"{self.model_id.replace('/', '_')}_versions.json")
-    
+
+    @staticmethod
+    def _content_hash(active_version: str, payloads: Dict[str, bytes]) -> bytes:
+        """Digest of the serialized history, for skipping no-op saves."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(active_version.encode("utf-8"))
+        for version_id in sorted(payloads):
+            digest.update(version_id.encode("utf-8"))
+            digest.update(payloads[version_id])
+        return digest.digest()
+
+    def _serialize_versions(self) -> Dict[str, bytes]:
+        """Serialize every version's metadata to payload bytes."""
+        if orjson is not None:
+            return {
+                version_id: orjson.dumps(metadata.to_dict())
+                for version_id, metadata in self.versions.items()
+            }
+        return {
+            version_id: json.dumps(metadata.to_dict()).encode("utf-8")
+            for version_id, metadata in self.versions.items()
+        }
+
     def _load_version_history(self) -> None:
-        """Load version history from file."""
+        """Load version history from the shared registry."""
+        try:
+            active_version, payloads = self._store.load_model(self.model_id)
+        except Exception as e:
+            logger.error(f"Error loading version history for {self.model_id}: {str(e)}")
+            return
+
+        if not payloads:
+            # First run against the registry: import any legacy
+            # per-model JSON file written by older deployments
+            self._migrate_legacy_json()
+            return
+
+        try:
+            if active_version:
+                self.active_version = active_version
+            for version_id, payload in payloads.items():
+                version_data = orjson.loads(payload) if orjson is not None else json.loads(payload)
+                self.versions[version_id] = ModelMetadata.from_dict(version_data)
+            self._last_hash = self._content_hash(self.active_version, payloads)
+
+            logger.debug(f"Loaded version history for {self.model_id}: {len(self.versions)} versions")
+        except Exception as e:
+            logger.error(f"Error loading version history for {self.model_id}: {str(e)}")
+            # Initialize with empty versions if loading fails
+            self.versions = {}
+            self.active_version = "latest"
+
+    def _migrate_legacy_json(self) -> None:
+        """One-time import of the old {model}_versions.json layout."""
         metadata_path = self._get_metadata_path()
-        if os.path.exists(metadata_path):
-            try:
-                with open(metadata_path, 'r') as f:
-                    data = json.load(f)
-                    
-                self.active_version = data.get("active_version", "latest")
-                for version_id, version_data in data.get("versions", {}).items():
-                    self.versions[version_id] = ModelMetadata.from_dict(version_data)
-                    
-                logger.debug(f"Loaded version history for {self.model_id}: {len(self.versions)} versions")
-            except Exception as e:
-                logger.error(f"Error loading version history for {self.model_id}: {str(e)}")
-                # Initialize with empty versions if loading fails
-                self.versions = {}
-                self.active_version = "latest"
-    
+        if not os.path.exists(metadata_path):
+            return
+        try:
+            with open(metadata_path, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+            self.active_version = data.get("active_version", "latest")
+            for version_id, version_data in data.get("versions", {}).items():
+                self.versions[version_id] = ModelMetadata.from_dict(version_data)
+
+            self._save_version_history()
+            logger.info(f"Migrated legacy version history for {self.model_id} into the registry")
+        except Exception as e:
+            logger.error(f"Error migrating version history for {self.model_id}: {str(e)}")
+            self.versions = {}
+            self.active_version = "latest"
+
     def _save_version_history(self) -> None:
-        """Save version history to file."""
-        metadata_path = self._get_metadata_path()
+        """Persist version history to the shared registry."""
         try:
-            data = {
-                "model_id": self.model_id,
-                "active_version": self.active_version,
-                "versions": {version_id: metadata.to_dict() for version_id, metadata in self.versions.items()}
-            }
-            
-            with open(metadata_path, 'w') as f:
-                json.dump(data, f, indent=2)
-                
+            payloads = self._serialize_versions()
+
+            # Skip the transaction when nothing changed (e.g. add_version
+            # re-persisting unchanged metadata after a model load)
+            content_hash = self._content_hash(self.active_version, payloads)
+            if content_hash == self._last_hash:
+                logger.debug(f"Version history for {self.model_id} unchanged; skipping write")
+                return
+
+            self._store.replace_model(self.model_id, self.active_version, payloads)
+            self._last_hash = content_hash
+
             logger.debug(f"Saved version history for {self.model_id}")
         except Exception as e:
             logger.error(f"Error saving version history for {self.model_id}: {str(e)}")
-    
+
+    def _mark_dirty(self) -> None:
+        """
+        Record a pending change and schedule a debounced flush.
+
+        The three default registrations at startup plus the post-load
+        metadata update each rewrote the whole file; with the debounce
+        they collapse into a single write per flush window.
+        """
+        with self._save_lock:
+            self._dirty = True
+            if self._flush_timer is None or not self._flush_timer.is_alive():
+                timer = threading.Timer(self._FLUSH_DELAY_SECONDS, self.flush)
+                timer.daemon = True
+                timer.start()
+                self._flush_timer = timer
+
+    def flush(self) -> None:
+        """Write any pending version-history changes immediately."""
+        with self._save_lock:
+            if self._flush_timer is not None:
+                # Cancel any still-pending debounce timer so it stops
+                # holding a reference to this history (no-op when the
+                # timer itself is what invoked us)
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._save_version_history()
+
     def add_version(self, metadata: ModelMetadata) -> None:
         """Add a new version to the history."""
         # If adding the "latest" version, check if we already have one
@@ -155,7 +404,7 @@ class ModelVersionHistory:
                 logger.debug(f"Updating existing 'latest' version for model {self.model_id}")
                 self.versions["latest"] = metadata
                 self.active_version = "latest"
-                self._save_version_history()
+                self._mark_dirty()
                 return
             
             # Only create timestamp version if we need a specific versioned copy
@@ -165,7 +414,7 @@ class ModelVersionHistory:
         
         self.versions[metadata.version] = metadata
         self.active_version = metadata.version  # Make this the active version
-        self._save_version_history()
+        self._mark_dirty()
         logger.info(f"Added version {metadata.version} to model {self.model_id}")
     
     def get_version(self, version: Optional[str] = None) -> Optional[ModelMetadata]:
@@ -177,7 +426,7 @@ class ModelVersionHistory:
         """Set the active version."""
         if version in self.versions:
             self.active_version = version
-            self._save_version_history()
+            self._mark_dirty()
             logger.info(f"Set active version to {version} for model {self.model_id}")
             return True
         return False
@@ -203,12 +452,27 @@ class ModelVersionHistory:
                 return False
             
             del self.versions[version]
-            self._save_version_history()
+            self._mark_dirty()
             logger.info(f"Deleted version {version} from model {self.model_id}")
             return True
         return False
 
 
+# Live histories with potentially unflushed changes. The WeakSet keeps
+# the exit hook from extending any history's lifetime; entries vanish
+# when their last real referent does.
+_live_histories: "weakref.WeakSet[ModelVersionHistory]" = weakref.WeakSet()
+
+
+def _flush_live_histories() -> None:
+    """Flush pending version-history writes at interpreter exit."""
+    for history in list(_live_histories):
+        history.flush()
+
+
+atexit.register(_flush_live_histories)
+
+
 class ModelManager:
     """
     Manages NLP models with lazy loading to optimize memory usage.
@@ -217,12 +481,14 @@ class ModelManager:
     for future use. Provides model metadata and versioning support.
     """
 
-    def __init__(self, models_dir: Optional[str] = None):
+    def __init__(self, models_dir: Optional[str] = None, warm: bool = False):
         """
         Initialize the model manager.
-        
+
         Args:
             models_dir: Directory to store downloaded models. If None, uses config setting.
+            warm: If True, start loading the default models in parallel
+                background threads so first requests hit a warm cache.
         """
         self.models_dir = models_dir or settings.MODEL_PATH
         self._ensure_models_dir()
@@ -232,12 +498,26 @@ class ModelManager:
         self._tokenizers: Dict[str, Dict[str, PreTrainedTokenizer]] = {}  # model_id -> {version -> tokenizer}
         self._metadata: Dict[str, ModelMetadata] = {}
         
-        # Version history tracking
+        # Version history tracking, built lazily per model on first use
         self._version_history: Dict[str, ModelVersionHistory] = {}
-        
-        # Register default models with metadata
-        self._register_default_models()
-        
+
+        # In-memory access times keyed by (model_id, cache version);
+        # updating one is a plain dict write, so hot get_model calls
+        # never touch persisted metadata
+        self._access_times: Dict[Tuple[str, str], float] = {}
+
+        # Guards cache writes when warm loading runs in worker threads
+        self._cache_lock = threading.Lock()
+
+        # Default registration is deferred to ensure_defaults_registered
+        # so constructing the manager (including the import-time
+        # singleton below) does no metadata I/O
+        self._defaults_registered = False
+
+        if warm:
+            self.ensure_defaults_registered()
+            self._warm_default_models()
+
         logger.info(f"ModelManager initialized with models directory: {self.models_dir}")
 
     def _ensure_models_dir(self) -> None:
@@ -247,6 +527,61 @@ class ModelManager:
         os.makedirs(metadata_dir, exist_ok=True)
         logger.debug(f"Ensured models directory exists: {self.models_dir}")
 
+    def _get_history(self, model_id: str) -> ModelVersionHistory:
+        """Get the version history for a model, building it on first access."""
+        history = self._version_history.get(model_id)
+        if history is None:
+            history = ModelVersionHistory(model_id)
+            self._version_history[model_id] = history
+        return history
+
+    def ensure_defaults_registered(self) -> None:
+        """
+        Register the default models exactly once.
+
+        Called explicitly from application startup; the lookup methods
+        also fall back to it behind a flag check so ad-hoc managers
+        (e.g. in scripts and tests) keep working without the hook.
+        """
+        if self._defaults_registered:
+            return
+        self._defaults_registered = True
+        self._register_default_models()
+
+    def _warm_default_models(self) -> None:
+        """
+        Kick off parallel background loads of the registered models.
+
+        from_pretrained releases the GIL during download I/O and the
+        torch-side deserialization, so loading each model on its own
+        thread overlaps network, disk and decode work instead of paying
+        the first-call latency for each model in sequence. Failures are
+        logged and left to the lazy path to retry on first request.
+        """
+        model_ids = list(self._version_history.keys())
+        if not model_ids:
+            return
+
+        def warm_load(model_id: str) -> None:
+            try:
+                history = self._get_history(model_id)
+                version = history.active_version
+                metadata = history.get_version(version)
+                if metadata:
+                    self._load_model(model_id, version, metadata)
+            except Exception as e:
+                logger.error(f"Warm load failed for model {model_id}: {str(e)}")
+
+        # Fire-and-forget: shutdown(wait=False) lets already-submitted
+        # loads finish on the worker threads without blocking __init__
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(model_ids), os.cpu_count() or 1),
+            thread_name_prefix="model-warm",
+        )
+        for model_id in model_ids:
+            executor.submit(warm_load, model_id)
+        executor.shutdown(wait=False)
+
     def _register_default_models(self) -> None:
         """Register default models with their metadata."""
         # Register the default model from settings
@@ -294,12 +629,8 @@ class ModelManager:
         else:
             metadata.version = version
             
-        # Ensure we have a version history for this model
-        if model_id not in self._version_history:
-            self._version_history[model_id] = ModelVersionHistory(model_id)
-        
-        # Add this version to the history
-        self._version_history[model_id].add_version(metadata)
+        # Add this version to the (lazily built) history
+        self._get_history(model_id).add_version(metadata)
         
         # Initialize model and tokenizer caches if needed
         if model_id not in self._models:
@@ -325,11 +656,12 @@ class ModelManager:
         Raises:
             ValueError: If the model is not registered or fails to load
         """
+        self.ensure_defaults_registered()
         model_id = model_id or settings.DEFAULT_MODEL
-        
+
         if model_id not in self._version_history:
             raise ValueError(f"Model {model_id} is not registered. Register it first.")
-        
+
         # Get the appropriate version to load
         history = self._version_history[model_id]
         version = version or history.active_version
@@ -339,17 +671,29 @@ class ModelManager:
         if not metadata:
             raise ValueError(f"Version {version} of model {model_id} is not available")
         
-        # Update the last used timestamp
-        metadata.last_used = time.time()
-        
+        # Quantized variants live under a distinct cache key so fp32 and
+        # int8 copies of the same version can coexist
+        cache_version = self._cache_version(version)
+
+        # Update the last used timestamp (in-memory only; persistence
+        # would mean disk I/O on every inference)
+        now = time.time()
+        metadata.last_used = now
+        self._access_times[(model_id, cache_version)] = now
+
         # Lazy loading: only load if not already loaded
-        if model_id not in self._models or version not in self._models[model_id]:
+        if model_id not in self._models or cache_version not in self._models[model_id]:
             logger.info(f"Lazy loading model: {model_id} version: {version}")
             self._load_model(model_id, version, metadata)
         else:
             logger.debug(f"Using cached model: {model_id} version: {version}")
-        
-        return self._models[model_id][version], self._tokenizers[model_id][version], metadata
+
+        return self._models[model_id][cache_version], self._tokenizers[model_id][cache_version], metadata
+
+    @staticmethod
+    def _cache_version(version: str) -> str:
+        """Cache key for a version, suffixed when int8 quantization applies."""
+        return f"{version}-int8" if _quantization_enabled() else version
 
     def _load_model(self, model_id: str, version: str, metadata: ModelMetadata) -> None:
         """
@@ -364,8 +708,10 @@ class ModelManager:
             RuntimeError: If loading fails
         """
         start_time = time.time()
-        
+
         try:
+            torch_dtype = _resolve_model_dtype()
+
             # Construct the local path for this version
             local_path = os.path.join(
                 self.models_dir, 
@@ -375,40 +721,82 @@ class ModelManager:
             # Check if model exists locally
             if os.path.exists(local_path):
                 logger.info(f"Loading model from local path: {local_path}")
-                model = AutoModelForSequenceClassification.from_pretrained(local_path)
+                # Prefer safetensors weights when present: they are
+                # memory-mapped straight into process VM instead of
+                # pickle-deserialized through torch.load, so cold starts
+                # skip the intermediate copy and pages load on demand
+                use_safetensors = os.path.exists(
+                    os.path.join(local_path, "model.safetensors")
+                )
+                model = AutoModelForSequenceClassification.from_pretrained(
+                    local_path,
+                    use_safetensors=True if use_safetensors else None,
+                    torch_dtype=torch_dtype,
+                )
                 tokenizer = AutoTokenizer.from_pretrained(local_path)
             else:
                 logger.info(f"Downloading model from Hugging Face: {model_id}")
-                model = AutoModelForSequenceClassification.from_pretrained(model_id)
+                model = AutoModelForSequenceClassification.from_pretrained(
+                    model_id, torch_dtype=torch_dtype
+                )
                 tokenizer = AutoTokenizer.from_pretrained(model_id)
-                
-                # Save the model locally for future use
+
+                # Save the model locally for future use; safetensors so
+                # the next load takes the mmap path above
                 os.makedirs(local_path, exist_ok=True)
-                model.save_pretrained(local_path)
+                model.save_pretrained(local_path, safe_serialization=True)
                 tokenizer.save_pretrained(local_path)
             
-            # Store in cache
-            if model_id not in self._models:
-                self._models[model_id] = {}
-            if model_id not in self._tokenizers:
-                self._tokenizers[model_id] = {}
-                
-            self._models[model_id][version] = model
-            self._tokenizers[model_id][version] = tokenizer
-            
+            # On CPU, optionally rewrite Linear weights as int8 with
+            # dynamically quantized activations: these classifiers are
+            # dominated by Linear matmuls, so the hot path runs int8
+            # kernels instead of fp32 GEMM at a small accuracy cost
+            quantized = _quantization_enabled()
+            if quantized:
+                model = torch.quantization.quantize_dynamic(
+                    model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+                logger.info(f"Applied dynamic int8 quantization to {model_id} version {version}")
+
+            # Store in cache; warm loading runs this from worker
+            # threads, so cache writes go through the lock
+            cache_version = self._cache_version(version)
+            with self._cache_lock:
+                if model_id not in self._models:
+                    self._models[model_id] = {}
+                if model_id not in self._tokenizers:
+                    self._tokenizers[model_id] = {}
+
+                self._models[model_id][cache_version] = model
+                self._tokenizers[model_id][cache_version] = tokenizer
+
             # Update metadata
             load_time = time.time() - start_time
             metadata.load_time = load_time
             metadata.last_used = time.time()
+            self._access_times[(model_id, cache_version)] = metadata.last_used
             
-            # Get model size
-            model_size_bytes = sum(
-                os.path.getsize(os.path.join(dirpath, filename)) 
-                for dirpath, _, filenames in os.walk(local_path) 
-                for filename in filenames
-            ) if os.path.exists(local_path) else 0
-            metadata.size_mb = model_size_bytes / (1024 * 1024)
-            
+            # Get model size; skip the directory walk entirely when the
+            # checkpoint dir hasn't changed since size_mb was measured
+            if os.path.exists(local_path):
+                dir_mtime = os.stat(local_path).st_mtime
+                if (metadata.size_mb is None
+                        or metadata.size_snapshot_mtime != dir_mtime):
+                    metadata.size_mb = _dir_size_bytes(local_path) / (1024 * 1024)
+                    metadata.size_snapshot_mtime = dir_mtime
+            else:
+                metadata.size_mb = 0.0
+
+            # Record the weight dtype actually used for this load
+            metadata.performance_metrics["dtype"] = str(torch_dtype).replace("torch.", "")
+            if quantized:
+                # On-disk size doesn't reflect the quantized copy; report
+                # the in-memory footprint instead, and drop the directory
+                # snapshot so an fp32 reload re-measures from disk
+                metadata.size_mb = _state_dict_size_mb(model)
+                metadata.size_snapshot_mtime = None
+                metadata.performance_metrics["quantized"] = True
+
             logger.info(f"Model {model_id} version {version} loaded in {load_time:.2f} seconds")
             
             # If the model doesn't have classes in metadata, try to extract them
@@ -437,8 +825,9 @@ class ModelManager:
         Raises:
             ValueError: If the model is not registered
         """
+        self.ensure_defaults_registered()
         model_id = model_id or settings.DEFAULT_MODEL
-        
+
         if model_id not in self._version_history:
             raise ValueError(f"Model {model_id} is not registered")
         
@@ -461,8 +850,9 @@ class ModelManager:
         Returns:
             List of model metadata dictionaries
         """
+        self.ensure_defaults_registered()
         result = []
-        
+
         for model_id, history in self._version_history.items():
             active_metadata = history.get_version()
             
@@ -493,9 +883,10 @@ class ModelManager:
         Returns:
             True if successful, False otherwise
         """
+        self.ensure_defaults_registered()
         if model_id not in self._version_history:
             return False
-            
+
         return self._version_history[model_id].set_active_version(version)
 
     def add_model_version(self, model_id: str, version: str, 
@@ -516,9 +907,10 @@ class ModelManager:
         Raises:
             ValueError: If the model is not registered
         """
+        self.ensure_defaults_registered()
         if model_id not in self._version_history:
             raise ValueError(f"Model {model_id} is not registered. Register it first.")
-            
+
         # Get the base metadata from the active version
         base_metadata = self._version_history[model_id].get_version()
         if not base_metadata:
@@ -561,16 +953,25 @@ class ModelManager:
             return False
             
         if version:
+            # Resolve the logical version to its cache key (quantized
+            # copies live under a '-int8' suffix); callers that already
+            # hold a cache key, like unload_unused_models, match as-is
+            if version not in self._models[model_id]:
+                version = self._cache_version(version)
+
             # Unload specific version
             if version in self._models[model_id]:
                 del self._models[model_id][version]
                 if version in self._tokenizers[model_id]:
                     del self._tokenizers[model_id][version]
+                self._access_times.pop((model_id, version), None)
                 logger.info(f"Unloaded model: {model_id} version: {version}")
                 return True
             return False
         else:
             # Unload all versions
+            for unloaded_version in self._models[model_id]:
+                self._access_times.pop((model_id, unloaded_version), None)
             del self._models[model_id]
             if model_id in self._tokenizers:
                 del self._tokenizers[model_id]
@@ -589,19 +990,14 @@ class ModelManager:
         """
         current_time = time.time()
         unloaded_count = 0
-        
+
         for model_id in list(self._models.keys()):
-            history = self._version_history.get(model_id)
-            if not history:
-                continue
-                
             for version in list(self._models[model_id].keys()):
-                metadata = history.get_version(version)
-                if (metadata and metadata.last_used and 
-                    current_time - metadata.last_used > threshold_seconds):
+                last_used = self._access_times.get((model_id, version))
+                if last_used and current_time - last_used > threshold_seconds:
                     if self.unload_model(model_id, version):
                         unloaded_count += 1
-        
+
         return unloaded_count
 
 
@@ -0,0 +1,117 @@
+"""
+Unit tests for session-history pagination.
+
+The endpoint is driven directly with fake repositories, pinning the
+limit+1 has_more probe and the keyset cursor round-trip: next_cursor
+emitted on one page must translate into the keyset filter on the next.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+import app.api.v1.history as history
+from app.models.database import SentimentResult
+
+
+def make_results(count):
+    """Build descending-timestamp results, newest first."""
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        SentimentResult(
+            session_id="session-1",
+            text=f"text {i}",
+            model_name="test-model",
+            label="positive",
+            confidence=0.9,
+            scores={"positive": 0.9},
+            text_length=10,
+            processing_time_ms=1.0,
+            timestamp=base - timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+
+
+class FakeSentimentRepository:
+    """Records get_by_session_id calls and serves canned results."""
+
+    def __init__(self, results):
+        self.results = results
+        self.calls = []
+
+    async def get_by_session_id(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.results[: kwargs["limit"]]
+
+
+class FakeSessionRepository:
+    async def get_many(self, **kwargs):
+        return []
+
+
+async def call_endpoint(monkeypatch, results, **kwargs):
+    """Invoke the endpoint with fakes, returning (payload, repo)."""
+    repository = FakeSentimentRepository(results)
+    monkeypatch.setattr(history, "sentiment_repository", repository)
+    monkeypatch.setattr(history, "user_session_repository", FakeSessionRepository())
+
+    kwargs.setdefault("limit", 5)
+    kwargs.setdefault("skip", 0)
+    kwargs.setdefault("cursor", None)
+    response = await history.get_session_history("session-1", **kwargs)
+    return json.loads(response.body), repository
+
+
+class TestSessionHistoryPagination:
+    """Tests for has_more and the keyset cursor."""
+
+    @pytest.mark.anyio
+    async def test_full_page_with_next_row_sets_has_more(self, monkeypatch):
+        """limit+1 probe: an extra row means has_more, trimmed output."""
+        payload, _ = await call_endpoint(monkeypatch, make_results(6), limit=5)
+
+        assert payload["pagination"]["has_more"] is True
+        assert payload["pagination"]["count"] == 5
+        assert len(payload["results"]) == 5
+
+    @pytest.mark.anyio
+    async def test_short_page_has_no_more(self, monkeypatch):
+        """A page shorter than the limit reports has_more False."""
+        payload, _ = await call_endpoint(monkeypatch, make_results(3), limit=5)
+
+        assert payload["pagination"]["has_more"] is False
+        assert payload["pagination"]["next_cursor"] is None
+
+    @pytest.mark.anyio
+    async def test_next_cursor_marks_last_returned_row(self, monkeypatch):
+        """next_cursor encodes the trimmed page's final (timestamp, id)."""
+        results = make_results(6)
+        payload, _ = await call_endpoint(monkeypatch, results, limit=5)
+
+        last = results[4]
+        expected = f"{last.timestamp.isoformat()}|{last.id}"
+        assert payload["pagination"]["next_cursor"] == expected
+
+    @pytest.mark.anyio
+    async def test_cursor_translates_to_keyset_filter(self, monkeypatch):
+        """A supplied cursor becomes the keyset tuple and disables skip."""
+        timestamp = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        cursor = f"{timestamp.isoformat()}|abc123"
+        _, repository = await call_endpoint(
+            monkeypatch, make_results(2), cursor=cursor, skip=40
+        )
+
+        call = repository.calls[0]
+        assert call["before"] == (timestamp, "abc123")
+        assert call["skip"] is None
+
+    @pytest.mark.anyio
+    async def test_malformed_cursor_is_rejected(self, monkeypatch):
+        """A cursor that doesn't parse returns 400, not 500."""
+        with pytest.raises(HTTPException) as exc_info:
+            await call_endpoint(monkeypatch, make_results(1), cursor="not-a-cursor")
+
+        assert exc_info.value.status_code == 400
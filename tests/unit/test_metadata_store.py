@@ -0,0 +1,95 @@
+"""
+Unit tests for the SQLite model-metadata registry.
+
+Covers the raw MetadataStore contract (replace/load round-trips and
+full-replacement semantics) and ModelVersionHistory's persistence on
+top of it, including the one-time migration of the legacy per-model
+JSON layout.
+"""
+
+import json
+import os
+
+from app.services.metadata_store import MetadataStore
+from app.services.model_manager import ModelMetadata, ModelVersionHistory
+
+
+class TestMetadataStore:
+    """Tests for the raw store contract."""
+
+    def test_replace_and_load_round_trip(self, tmp_path):
+        """Stored payloads and the active pointer read back unchanged."""
+        store = MetadataStore(str(tmp_path / "registry.db"))
+
+        store.replace_model("model-a", "v2", {"v1": b"one", "v2": b"two"})
+        active, payloads = store.load_model("model-a")
+
+        assert active == "v2"
+        assert payloads == {"v1": b"one", "v2": b"two"}
+
+    def test_replace_is_a_full_replacement(self, tmp_path):
+        """A second replace drops versions absent from the new payload set."""
+        store = MetadataStore(str(tmp_path / "registry.db"))
+        store.replace_model("model-a", "v1", {"v1": b"one", "v2": b"two"})
+
+        store.replace_model("model-a", "v2", {"v2": b"two-updated"})
+        active, payloads = store.load_model("model-a")
+
+        assert active == "v2"
+        assert payloads == {"v2": b"two-updated"}
+
+    def test_models_are_isolated(self, tmp_path):
+        """Replacing one model leaves other models' versions intact."""
+        store = MetadataStore(str(tmp_path / "registry.db"))
+        store.replace_model("model-a", "v1", {"v1": b"a"})
+        store.replace_model("model-b", "v1", {"v1": b"b"})
+
+        store.replace_model("model-a", "v1", {"v1": b"a2"})
+
+        assert store.load_model("model-b") == ("v1", {"v1": b"b"})
+
+    def test_unknown_model_loads_empty(self, tmp_path):
+        """A model with no stored versions yields (None, {})."""
+        store = MetadataStore(str(tmp_path / "registry.db"))
+
+        assert store.load_model("missing") == (None, {})
+
+
+class TestModelVersionHistoryPersistence:
+    """Tests for version history stored through the registry."""
+
+    def test_round_trip_through_registry(self, tmp_path):
+        """A flushed history is visible to a fresh instance."""
+        history = ModelVersionHistory("test/model", metadata_dir=str(tmp_path))
+        metadata = ModelMetadata("test/model", version="v1", description="first")
+        history.add_version(metadata)
+        history.flush()
+
+        reloaded = ModelVersionHistory("test/model", metadata_dir=str(tmp_path))
+
+        assert reloaded.active_version == "v1"
+        assert reloaded.versions["v1"].description == "first"
+
+    def test_legacy_json_is_migrated_into_the_registry(self, tmp_path):
+        """An old per-model JSON file seeds the registry on first load."""
+        legacy = {
+            "active_version": "v2",
+            "versions": {
+                "v1": ModelMetadata("test/model", version="v1").to_dict(),
+                "v2": ModelMetadata("test/model", version="v2").to_dict(),
+            },
+        }
+        legacy_path = tmp_path / "test_model_versions.json"
+        legacy_path.write_text(json.dumps(legacy))
+
+        history = ModelVersionHistory("test/model", metadata_dir=str(tmp_path))
+
+        assert history.active_version == "v2"
+        assert set(history.versions) == {"v1", "v2"}
+
+        # The migration persisted immediately: a second instance reads
+        # from the registry even with the legacy file gone
+        os.remove(legacy_path)
+        reloaded = ModelVersionHistory("test/model", metadata_dir=str(tmp_path))
+        assert reloaded.active_version == "v2"
+        assert set(reloaded.versions) == {"v1", "v2"}
@@ -0,0 +1,100 @@
+"""
+Unit tests for the hand-rolled ASGI middleware.
+
+These drive WildcardCORSMiddleware with scripted ASGI exchanges and
+verify the CORS contract the browser actually enforces: the request's
+Origin must be echoed back (never a literal "*") because the config
+allows credentials.
+"""
+
+import asyncio
+
+from app.core.middleware import WildcardCORSMiddleware
+
+
+async def plain_app(scope, receive, send):
+    """Minimal downstream app returning an empty 200."""
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [(b"content-type", b"application/json")],
+    })
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+def run_request(method="GET", headers=None):
+    """Run one request through the middleware, returning sent messages."""
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": "/",
+        "headers": headers or [],
+    }
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    middleware = WildcardCORSMiddleware(plain_app)
+    asyncio.run(middleware(scope, receive, send))
+    return sent
+
+
+def response_headers(sent):
+    """Extract the header list from the http.response.start message."""
+    return dict(sent[0]["headers"])
+
+
+class TestWildcardCORSMiddleware:
+    """Tests for the credentialed wildcard CORS behavior."""
+
+    def test_simple_request_echoes_origin(self):
+        """The concrete Origin is echoed, never a literal '*'."""
+        sent = run_request(headers=[(b"origin", b"https://example.com")])
+        headers = response_headers(sent)
+        assert headers[b"access-control-allow-origin"] == b"https://example.com"
+        assert headers[b"access-control-allow-credentials"] == b"true"
+        assert headers[b"vary"] == b"origin"
+
+    def test_simple_request_preserves_app_headers(self):
+        """Downstream response headers survive the CORS append."""
+        sent = run_request(headers=[(b"origin", b"https://example.com")])
+        headers = response_headers(sent)
+        assert headers[b"content-type"] == b"application/json"
+
+    def test_request_without_origin_gets_no_cors_headers(self):
+        """Same-origin requests pass through untouched."""
+        sent = run_request()
+        headers = response_headers(sent)
+        assert b"access-control-allow-origin" not in headers
+        assert b"access-control-allow-credentials" not in headers
+
+    def test_preflight_echoes_origin_and_requested_headers(self):
+        """Preflights answer from the middleware with the origin echoed."""
+        sent = run_request(
+            method="OPTIONS",
+            headers=[
+                (b"origin", b"https://example.com"),
+                (b"access-control-request-method", b"POST"),
+                (b"access-control-request-headers", b"x-api-key"),
+            ],
+        )
+        assert sent[0]["status"] == 200
+        headers = response_headers(sent)
+        assert headers[b"access-control-allow-origin"] == b"https://example.com"
+        assert headers[b"access-control-allow-headers"] == b"x-api-key"
+        assert headers[b"access-control-allow-credentials"] == b"true"
+
+    def test_plain_options_request_reaches_the_app(self):
+        """OPTIONS without access-control-request-method is not a preflight."""
+        sent = run_request(
+            method="OPTIONS",
+            headers=[(b"origin", b"https://example.com")],
+        )
+        headers = response_headers(sent)
+        # Served by the downstream app, with simple CORS headers appended
+        assert headers[b"content-type"] == b"application/json"
+        assert headers[b"access-control-allow-origin"] == b"https://example.com"
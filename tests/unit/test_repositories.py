@@ -0,0 +1,201 @@
+"""
+Unit tests for repository internals that don't need a live database.
+
+Fake collections stand in for Motor so the label change-stream watcher
+and the micro-batching insert coalescer can be exercised in isolation,
+including the standalone-deployment path where collection.watch() is
+unavailable.
+"""
+
+import asyncio
+
+import pytest
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from app.database.repositories.base import BaseRepository
+from app.database.repositories.sentiment_repository import SentimentRepository
+
+
+class FakeChangeStream:
+    """Async-context-manager change stream that yields no events."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        raise StopAsyncIteration
+
+
+class FakeCursor:
+    """Aggregation cursor returning a canned result list."""
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    async def to_list(self, length=None):
+        return self._rows
+
+
+class FakeCollection:
+    """Collection double recording the order of watch/aggregate calls."""
+
+    def __init__(self, seed_rows=None, watch_error=None):
+        self.calls = []
+        self._seed_rows = seed_rows or []
+        self._watch_error = watch_error
+
+    def watch(self, *args, **kwargs):
+        self.calls.append("watch")
+        if self._watch_error is not None:
+            raise self._watch_error
+        return FakeChangeStream()
+
+    def aggregate(self, *args, **kwargs):
+        self.calls.append("aggregate")
+        return FakeCursor(self._seed_rows)
+
+
+def make_repository(collection):
+    """Build a repository whose get_collection returns the fake."""
+    repository = SentimentRepository()
+
+    async def get_collection():
+        return collection
+
+    repository.get_collection = get_collection
+    return repository
+
+
+class TestLabelStreamWatcher:
+    """Tests for the change-stream label counter."""
+
+    @pytest.mark.anyio
+    async def test_watch_failure_falls_back_to_aggregation(self):
+        """Standalone mongo: watch() fails, counter stays unprimed."""
+        collection = FakeCollection(
+            watch_error=RuntimeError("The $changeStream stage is only supported on replica sets")
+        )
+        repository = make_repository(collection)
+
+        await repository._watch_labels()
+
+        assert repository._label_counter_primed is False
+        # Seed aggregation never ran - nothing was counted
+        assert collection.calls == ["watch"]
+
+    @pytest.mark.anyio
+    async def test_stream_opens_before_seed(self):
+        """The stream must be open before seeding, or inserts landing
+        during the aggregation are permanently missed."""
+        collection = FakeCollection(
+            seed_rows=[{"_id": "positive", "count": 3}, {"_id": "negative", "count": 1}]
+        )
+        repository = make_repository(collection)
+
+        await repository._watch_labels()
+
+        assert collection.calls == ["watch", "aggregate"]
+        assert repository._label_counter_primed is True
+        assert repository._label_counter["positive"] == 3
+        assert repository._label_counter["negative"] == 1
+
+
+class DictRepository(BaseRepository[dict]):
+    """Minimal concrete repository for exercising the base coalescer."""
+
+    def _to_document(self, model):
+        return dict(model)
+
+    def _from_document(self, document):
+        return document
+
+
+class FakeBulkCollection:
+    """Collection double recording each bulk_write's documents."""
+
+    def __init__(self, error=None):
+        self.batches = []
+        self._error = error
+
+    async def bulk_write(self, operations, ordered=True):
+        self.batches.append([operation._doc for operation in operations])
+        # Yield once so concurrent create() calls can interleave the way
+        # they would around a real network round-trip
+        await asyncio.sleep(0)
+        if self._error is not None:
+            raise self._error
+
+
+def make_coalescing_repository(error=None):
+    """Build a DictRepository bound to a fake bulk collection."""
+    repository = DictRepository("fake_collection")
+    collection = FakeBulkCollection(error=error)
+    repository._collection = collection
+    return repository, collection
+
+
+class TestCreateCoalescing:
+    """Tests for the micro-batching insert coalescer in BaseRepository."""
+
+    @pytest.mark.anyio
+    async def test_concurrent_creates_share_one_bulk_write(self):
+        """Creates landing within the batching window form one batch."""
+        repository, collection = make_coalescing_repository()
+
+        await asyncio.gather(
+            *(repository.create({"_id": str(i)}) for i in range(10))
+        )
+
+        assert len(collection.batches) == 1
+        assert len(collection.batches[0]) == 10
+
+    @pytest.mark.anyio
+    async def test_creates_outside_the_window_flush_separately(self):
+        """A create after the window elapses starts a new batch."""
+        repository, collection = make_coalescing_repository()
+
+        await repository.create({"_id": "a"})
+        await repository.create({"_id": "b"})
+
+        assert len(collection.batches) == 2
+
+    @pytest.mark.anyio
+    async def test_full_batch_flushes_without_waiting(self, monkeypatch):
+        """Hitting _BATCH_MAX_SIZE splits the writes at the cap."""
+        monkeypatch.setattr(DictRepository, "_BATCH_MAX_SIZE", 5)
+        repository, collection = make_coalescing_repository()
+
+        await asyncio.gather(
+            *(repository.create({"_id": str(i)}) for i in range(12))
+        )
+
+        assert len(collection.batches) >= 2
+        assert all(len(batch) <= 5 for batch in collection.batches)
+        assert sum(len(batch) for batch in collection.batches) == 12
+
+    @pytest.mark.anyio
+    async def test_bulk_write_error_maps_to_submitting_caller(self):
+        """Per-document failures raise only for the caller that owns them."""
+        error = BulkWriteError({
+            "writeErrors": [
+                {"index": 1, "code": 11000, "errmsg": "E11000 duplicate key"}
+            ]
+        })
+        repository, _ = make_coalescing_repository(error=error)
+
+        results = await asyncio.gather(
+            repository.create({"_id": "a"}),
+            repository.create({"_id": "a"}),
+            repository.create({"_id": "b"}),
+            return_exceptions=True,
+        )
+
+        assert results[0] == {"_id": "a"}
+        assert isinstance(results[1], DuplicateKeyError)
+        assert results[2] == {"_id": "b"}